@@ -0,0 +1,45 @@
+"""store shipping method cost in cents
+
+Revision ID: 3bd94270a175
+Revises: c01dbc845212
+Create Date: 2026-10-16 18:52:19.335367
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3bd94270a175'
+down_revision: Union[str, None] = 'c01dbc845212'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Conserva los datos: cost (pesos, NUMERIC) -> cost_cents (centavos, INTEGER)
+    op.alter_column(
+        'shipping_methods', 'cost',
+        new_column_name='cost_cents',
+        type_=sa.Integer(),
+        existing_type=sa.NUMERIC(precision=10, scale=2),
+        existing_nullable=False,
+        postgresql_using='round(cost * 100)::integer',
+        comment='El precio (en centavos) que será agregado a la orden si este método es escogido.',
+        existing_comment='El precio que será agregado a la orden si este método es escogido.',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'shipping_methods', 'cost_cents',
+        new_column_name='cost',
+        type_=sa.NUMERIC(precision=10, scale=2),
+        existing_type=sa.Integer(),
+        existing_nullable=False,
+        postgresql_using='cost_cents / 100.0',
+        comment='El precio que será agregado a la orden si este método es escogido.',
+        existing_comment='El precio (en centavos) que será agregado a la orden si este método es escogido.',
+    )
@@ -0,0 +1,77 @@
+"""store user shipping and subscription enums as char codes
+
+Revision ID: 63a854b72d69
+Revises: 3bd94270a175
+Create Date: 2026-10-16 18:54:13.156625
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '63a854b72d69'
+down_revision: Union[str, None] = '3bd94270a175'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabla, columna, tipo ENUM anterior, miembros, comentario anterior, comentario nuevo)
+# El código CHAR(1) es la inicial del nombre del miembro (ver CharEnum).
+_COLUMNS = [
+    (
+        'users', 'role', 'user_role_enum', ('USER', 'ADMIN'),
+        'Rol del usuario en la plataforma',
+        'Rol del usuario en la plataforma (U=USER, A=ADMIN)',
+    ),
+    (
+        'users', 'status', 'user_status_enum', ('PENDING', 'ACTIVE', 'BLOCKED'),
+        'Estado actual del usuario',
+        'Estado actual del usuario (P=PENDING, A=ACTIVE, B=BLOCKED)',
+    ),
+    (
+        'shipping_methods', 'type', 'shipping_type_enum', ('PICKUP', 'DELIVERY'),
+        "Define si es para recojo ('pickup') o para envío a casa ('delivery').",
+        "Define si es para recojo ('P') o para envío a casa ('D').",
+    ),
+    (
+        'subscriptions', 'status', 'subscription_status_enum', ('ACTIVE', 'INACTIVE', 'CANCELLED'),
+        'Estatus actual de la suscripcion (e.g., ACTIVE, INACTIVE, CANCELLED).',
+        'Estatus actual de la suscripcion (A=ACTIVE, I=INACTIVE, C=CANCELLED).',
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, column, enum_name, members, old_comment, new_comment in _COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.CHAR(1),
+            existing_type=sa.Enum(*members, name=enum_name),
+            existing_nullable=False,
+            postgresql_using=f'left({column}::text, 1)',
+            comment=new_comment,
+            existing_comment=old_comment,
+        )
+        codes = ", ".join(f"'{member[0]}'" for member in members)
+        op.create_check_constraint(f'ck_{table}_{column}', table, f'{column} IN ({codes})')
+        op.execute(f'DROP TYPE {enum_name}')
+
+
+def downgrade() -> None:
+    for table, column, enum_name, members, old_comment, new_comment in reversed(_COLUMNS):
+        enum_type = sa.Enum(*members, name=enum_name)
+        enum_type.create(op.get_bind())
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        cases = " ".join(f"WHEN '{member[0]}' THEN '{member}'" for member in members)
+        op.alter_column(
+            table, column,
+            type_=enum_type,
+            existing_type=sa.CHAR(1),
+            existing_nullable=False,
+            postgresql_using=f'(CASE {column} {cases} END)::{enum_name}',
+            comment=old_comment,
+            existing_comment=new_comment,
+        )
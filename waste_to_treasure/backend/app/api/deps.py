@@ -14,7 +14,7 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.core.config import get_settings, Settings
@@ -25,6 +25,10 @@ from app.models.user import User, UserRoleEnum, UserStatusEnum
 logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
+# Consulta del usuario autenticado, construida una sola vez: se ejecuta en
+# cada request y su SQL compilado queda en el cache del engine.
+_SELECT_USER_BY_ID = select(User).where(User.user_id == bindparam("user_id"))
+
 
 async def get_current_user_with_jit(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -121,7 +125,7 @@ async def get_current_user_with_jit(
     
     # Buscar usuario en la base de datos
     try:
-        result = await db.execute(select(User).where(User.user_id == user_id))
+        result = await db.execute(_SELECT_USER_BY_ID, {"user_id": user_id})
         user = result.scalar_one_or_none()
     except Exception as e:
         logger.error(f"❌ Error consultando usuario en BD: {str(e)}", exc_info=True)
@@ -220,7 +224,7 @@ async def get_current_user_with_jit(
             
             # Reintentar la consulta del usuario
             try:
-                result = await db.execute(select(User).where(User.user_id == user_id))
+                result = await db.execute(_SELECT_USER_BY_ID, {"user_id": user_id})
                 user = result.scalar_one_or_none()
                 
                 if user:
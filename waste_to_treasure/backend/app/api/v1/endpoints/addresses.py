@@ -10,7 +10,7 @@ Todos los endpoints requieren autenticación y validan ownership automáticament
 """
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, get_current_active_user
@@ -108,7 +108,7 @@ async def get_my_addresses(
     limit: int = Query(50, ge=1, le=100, description="Número máximo de registros"),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
-) -> AddressList:
+) -> Response:
     """
     Autor: Oscar Alonso Nava Rivera
     Descripción: Lista las direcciones del usuario actual (address book).
@@ -148,8 +148,8 @@ async def get_my_addresses(
     # Calcular página actual
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return AddressList(
-        items=addresses,
+    return AddressList.json_response(
+        items=[AddressRead.from_orm_trusted(address) for address in addresses],
         total=total,
         page=page,
         page_size=limit
@@ -207,7 +207,7 @@ async def get_address(
     
     address = await address_service.get_address_by_id(db, address_id, current_user)
     
-    return address
+    return AddressRead.from_orm_trusted(address)
 
 
 @router.patch(
@@ -13,7 +13,7 @@ Todos los endpoints requieren rol ADMIN.
 """
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, require_admin
@@ -58,7 +58,7 @@ async def get_users_list(
     limit: int = Query(50, ge=1, le=100, description="Número máximo de registros"),
     db: AsyncSession = Depends(get_async_db),
     current_admin: User = Depends(require_admin)
-) -> UserAdminList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -94,7 +94,7 @@ async def get_users_list(
     
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return UserAdminList(
+    return UserAdminList.json_response(
         items=items,
         total=total,
         page=page,
@@ -134,9 +134,7 @@ async def get_dashboard_stats(
     
     logger.info(f"Admin {current_admin.user_id} solicitando estadísticas del dashboard")
     
-    stats = await AdminService.get_dashboard_stats(db)
-    
-    return StatsDashboard(**stats)
+    return await AdminService.get_dashboard_stats(db)
 
 @router.get(
     "/moderation/listings/{listing_id}",
@@ -208,7 +206,7 @@ async def get_moderation_listings(
     limit: int = Query(50, ge=1, le=100, description="Número máximo de registros"),
     db: AsyncSession = Depends(get_async_db),
     current_admin: User = Depends(require_admin)
-) -> ModerationListingList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -241,7 +239,7 @@ async def get_moderation_listings(
     
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return ModerationListingList(
+    return ModerationListingList.json_response(
         items=items,
         total=total,
         page=page,
@@ -364,7 +362,7 @@ async def get_moderation_reports(
     limit: int = Query(50, ge=1, le=100, description="Número máximo de registros"),
     db: AsyncSession = Depends(get_async_db),
     current_admin: User = Depends(require_admin)
-) -> ReportList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -397,7 +395,7 @@ async def get_moderation_reports(
     
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return ReportList(
+    return ReportList.json_response(
         items=items,
         total=total,
         page=page,
@@ -471,7 +469,7 @@ async def get_admin_logs(
     limit: int = Query(50, ge=1, le=100, description="Número máximo de registros"),
     db: AsyncSession = Depends(get_async_db),
     current_admin: User = Depends(require_admin)
-) -> AdminActionLogList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -503,7 +501,7 @@ async def get_admin_logs(
     
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return AdminActionLogList(
+    return AdminActionLogList.json_response(
         items=items,
         total=total,
         page=page,
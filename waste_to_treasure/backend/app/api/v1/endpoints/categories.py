@@ -9,7 +9,7 @@ Todos los endpoints de modificación requieren permisos de administrador.
 # Descripción: Rutas de API para gestión de categorías (CRUD, list, tree)
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, require_admin
@@ -116,7 +116,7 @@ async def get_categories(
         description="Buscar por nombre de categoría"
     ),
     db: AsyncSession = Depends(get_async_db)
-) -> CategoryList:
+) -> Response:
     """
     Autor: Oscar Alonso Nava Rivera
     Lista categorías con filtros opcionales.
@@ -166,23 +166,15 @@ async def get_categories(
     # Convertir a CategoryRead y agregar conteos
     items_with_counts = []
     for category in categories:
-        # Crear diccionario con todos los datos de la categoría
-        category_dict = {
-            "category_id": category.category_id,
-            "name": category.name,
-            "slug": category.slug,
-            "type": category.type,
-            "parent_category_id": category.parent_category_id,
-            "created_at": category.created_at,
-            "updated_at": category.updated_at,
-            "full_path": getattr(category, 'full_path', None),
+        # Fila confiable de la BD: construir sin revalidar
+        items_with_counts.append(CategoryRead.from_orm_trusted(
+            category,
             # Añadir conteos de listings y children
-            "listing_count": len(category.listings) if hasattr(category, 'listings') and category.listings else 0,
-            "children_count": len(category.children) if hasattr(category, 'children') and category.children else 0
-        }
-        items_with_counts.append(CategoryRead(**category_dict))
+            listing_count=len(category.listings) if hasattr(category, 'listings') and category.listings else 0,
+            children_count=len(category.children) if hasattr(category, 'children') and category.children else 0
+        ))
     
-    return CategoryList(
+    return CategoryList.json_response(
         items=items_with_counts,
         total=total,
         page=page,
@@ -201,7 +193,7 @@ async def get_categories(
 )
 async def get_category_tree(
     db: AsyncSession = Depends(get_async_db)
-) -> CategoryTree:
+) -> Response:
     """
     Autor: Oscar Alonso Nava Rivera
     Obtiene el árbol jerárquico completo de categorías.
@@ -238,9 +230,9 @@ async def get_category_tree(
     
     tree_data = await category_service.get_category_tree(db)
     
-    return CategoryTree(
-        materials=tree_data["materials"],
-        products=tree_data["products"]
+    return Response(
+        content=CategoryTree.tree_adapter.dump_json(tree_data),
+        media_type="application/json"
     )
 
 
@@ -15,7 +15,7 @@ Endpoints públicos para lectura, endpoints admin para gestión.
 """
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, require_admin
@@ -57,7 +57,7 @@ async def get_faqs_public(
         examples=["Ventas", "Compras", "Cuenta"]
     ),
     db: AsyncSession = Depends(get_async_db)
-) -> FAQItemList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -83,8 +83,8 @@ async def get_faqs_public(
     
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return FAQItemList(
-        items=faqs,
+    return FAQItemList.json_response(
+        items=[FAQItemRead.from_orm_trusted(faq) for faq in faqs],
         total=total,
         page=page,
         page_size=limit
@@ -228,7 +228,7 @@ async def get_all_faqs_admin(
     category: Optional[str] = Query(None, description="Filtrar por categoría"),
     db: AsyncSession = Depends(get_async_db),
     current_admin: User = Depends(require_admin)
-) -> FAQItemList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -255,8 +255,8 @@ async def get_all_faqs_admin(
     
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return FAQItemList(
-        items=faqs,
+    return FAQItemList.json_response(
+        items=[FAQItemRead.from_orm_trusted(faq) for faq in faqs],
         total=total,
         page=page,
         page_size=limit
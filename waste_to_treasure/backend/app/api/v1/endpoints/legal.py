@@ -14,7 +14,7 @@ Endpoints públicos para lectura, endpoints admin para gestión.
 """
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, require_admin
@@ -74,16 +74,7 @@ async def get_legal_documents_public(
     )
     
     # Convertir a resumen sin contenido
-    summaries = [
-        LegalDocumentSummary(
-            document_id=doc.document_id,
-            title=doc.title,
-            slug=doc.slug,
-            version=doc.version,
-            updated_at=doc.updated_at
-        )
-        for doc in documents
-    ]
+    summaries = [LegalDocumentSummary.from_orm_trusted(doc) for doc in documents]
     
     return LegalDocumentSummaryList(items=summaries, total=total)
 
@@ -186,7 +177,7 @@ async def get_all_legal_documents_admin(
     limit: int = Query(50, ge=1, le=100, description="Número máximo de registros"),
     db: AsyncSession = Depends(get_async_db),
     current_admin: User = Depends(require_admin)
-) -> LegalDocumentList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -216,8 +207,8 @@ async def get_all_legal_documents_admin(
     
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return LegalDocumentList(
-        items=documents,
+    return LegalDocumentList.json_response(
+        items=[LegalDocumentRead.from_orm_trusted(doc) for doc in documents],
         total=total,
         page=page,
         page_size=limit
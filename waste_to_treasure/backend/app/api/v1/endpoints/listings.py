@@ -6,7 +6,7 @@ Endpoints de lectura son públicos, endpoints de modificación requieren autenti
 """
 import logging
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, get_current_active_user
@@ -117,7 +117,7 @@ async def list_public_listings(
     ),
     page: int = Query(1, ge=1, description="Número de página"),
     page_size: int = Query(20, ge=1, le=100, description="Elementos por página")
-) -> ListingListResponse:
+) -> Response:
     """
     Lista publicaciones activas con filtros y paginación.
 
@@ -152,17 +152,17 @@ async def list_public_listings(
         page_size=page_size
     )
 
-    # Convertir a cards
+    # Convertir a cards (valores de la BD, sin revalidar)
     items = [
-        ListingCardRead(**listing_service.convert_to_card_response(listing))
+        ListingCardRead.model_construct(**listing_service.convert_to_card_response(listing))
         for listing in listings
     ]
 
-    return ListingListResponse(
+    return ListingListResponse.json_response(
+        items=items,
         total=total,
         page=page,
-        page_size=page_size,
-        items=items
+        page_size=page_size
     )
 
 
@@ -184,7 +184,7 @@ async def list_my_listings(
     ),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100)
-) -> ListingListResponse:
+) -> Response:
     """
     Lista las publicaciones del usuario autenticado.
 
@@ -209,17 +209,17 @@ async def list_my_listings(
         page_size=page_size
     )
 
-    # Convertir a cards
+    # Convertir a cards (valores de la BD, sin revalidar)
     items = [
-        ListingCardRead(**listing_service.convert_to_card_response(listing))
+        ListingCardRead.model_construct(**listing_service.convert_to_card_response(listing))
         for listing in listings
     ]
 
-    return ListingListResponse(
+    return ListingListResponse.json_response(
+        items=items,
         total=total,
         page=page,
-        page_size=page_size,
-        items=items
+        page_size=page_size
     )
 
 
@@ -14,7 +14,7 @@ Implementa:
 """
 import logging
 from typing import Annotated, Dict
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, get_current_active_user
@@ -39,7 +39,7 @@ async def get_my_notifications(
     user: Annotated[User, Depends(get_current_active_user)],
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=50), # Límite más bajo para notificaciones
-) -> NotificationList:
+) -> Response:
     """
     Obtiene una lista paginada de las notificaciones del usuario autenticado.
     
@@ -64,8 +64,8 @@ async def get_my_notifications(
     
     page = (skip // limit) + 1
     
-    return NotificationList(
-        items=[NotificationRead.model_validate(n) for n in notifications],
+    return NotificationList.json_response(
+        items=[NotificationRead.from_orm_trusted(n) for n in notifications],
         total=total,
         page=page,
         page_size=limit,
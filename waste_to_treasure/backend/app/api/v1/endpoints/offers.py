@@ -6,7 +6,7 @@ Todos los endpoints requieren autenticación.
 """
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, get_current_active_user
@@ -101,7 +101,7 @@ async def list_sent_offers(
     ),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100)
-) -> OfferListResponse:
+) -> Response:
     """
     Lista las ofertas enviadas por el usuario (como comprador).
 
@@ -127,15 +127,15 @@ async def list_sent_offers(
     )
 
     items = [
-        OfferCardRead(**offer_service.convert_to_card_response(offer, current_user.user_id))
+        OfferCardRead.model_construct(**offer_service.convert_to_card_response(offer, current_user.user_id))
         for offer in offers
     ]
 
-    return OfferListResponse(
+    return OfferListResponse.json_response(
+        items=items,
         total=total,
         page=page,
-        page_size=page_size,
-        items=items
+        page_size=page_size
     )
 
 
@@ -157,7 +157,7 @@ async def list_received_offers(
     ),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100)
-) -> OfferListResponse:
+) -> Response:
     """
     Lista las ofertas recibidas por el usuario (como vendedor).
 
@@ -183,15 +183,15 @@ async def list_received_offers(
     )
 
     items = [
-        OfferCardRead(**offer_service.convert_to_card_response(offer, current_user.user_id))
+        OfferCardRead.model_construct(**offer_service.convert_to_card_response(offer, current_user.user_id))
         for offer in offers
     ]
 
-    return OfferListResponse(
+    return OfferListResponse.json_response(
+        items=items,
         total=total,
         page=page,
-        page_size=page_size,
-        items=items
+        page_size=page_size
     )
 
 
@@ -17,7 +17,7 @@ import logging
 import uuid
 from decimal import Decimal
 from typing import Annotated
-from fastapi import APIRouter, Depends, Query, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 import stripe
 from stripe import CardError, StripeError
@@ -106,7 +106,7 @@ async def process_checkout(
         from app.models.shipping_methods import ShippingMethod
         shipping_method = await db.get(ShippingMethod, checkout_data.shipping_method_id)
         if shipping_method:
-            shipping_cost = Decimal(str(shipping_method.cost))
+            shipping_cost = shipping_method.cost
             total_pesos += shipping_cost
             logger.info(f"Costo de envío agregado: ${shipping_cost} MXN (método: {shipping_method.name})")
         else:
@@ -290,7 +290,7 @@ async def get_my_purchases(
     user: Annotated[User, Depends(get_current_active_user)],
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-) -> OrderList:
+) -> Response:
     """
     Obtiene una lista paginada de las órdenes de compra del usuario autenticado.
     
@@ -311,7 +311,7 @@ async def get_my_purchases(
     orders, total = await order_service.get_my_purchases(db, user, skip, limit)
     page = (skip // limit) + 1
     
-    return OrderList(
+    return OrderList.json_response(
         items=[OrderRead.from_order(o) for o in orders],
         total=total,
         page=page,
@@ -330,7 +330,7 @@ async def get_my_sales(
     user: Annotated[User, Depends(get_current_active_user)],
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-) -> OrderList:
+) -> Response:
     """
     Obtiene una lista paginada de las órdenes que contienen items vendidos por el usuario autenticado.
     
@@ -351,7 +351,7 @@ async def get_my_sales(
     orders, total = await order_service.get_my_sales(db, user, skip, limit)
     page = (skip // limit) + 1
     
-    return OrderList(
+    return OrderList.json_response(
         items=[OrderRead.from_order(o) for o in orders],
         total=total,
         page=page,
@@ -106,7 +106,7 @@ async def create_customer(
         
         if existing_customer:
             logger.info(f"Customer existente encontrado: {existing_customer.gateway_customer_id}")
-            return PaymentCustomerRead.model_validate(existing_customer)
+            return PaymentCustomerRead.from_orm_trusted(existing_customer)
         
         # Crear customer en Stripe
         stripe_customer = await stripe_service.create_customer(
@@ -125,7 +125,7 @@ async def create_customer(
         )
         
         logger.info(f"Customer creado: {customer.gateway_customer_id} para usuario {user.user_id}")
-        return PaymentCustomerRead.model_validate(customer)
+        return PaymentCustomerRead.from_orm_trusted(customer)
         
     except StripeError as e:
         logger.error(f"Error en Stripe creando customer: {e}")
@@ -168,7 +168,7 @@ async def get_my_customer(
             detail="No tienes un customer de Stripe. Créalo primero con POST /customers"
         )
     
-    return PaymentCustomerRead.model_validate(customer)
+    return PaymentCustomerRead.from_orm_trusted(customer)
 
 
 # ==========================================
@@ -13,7 +13,7 @@ sobre contenido, otros usuarios u órdenes.
 Todos los endpoints requieren autenticación.
 """
 import logging
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_async_db, get_current_active_user
@@ -96,7 +96,7 @@ async def get_my_reports(
     limit: int = Query(50, ge=1, le=100, description="Número máximo de registros"),
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
-) -> ReportList:
+) -> Response:
     
     """
     Autor: Gabriel Florentino Reyes
@@ -129,8 +129,9 @@ async def get_my_reports(
     # Calcular página actual
     page = (skip // limit) + 1 if limit > 0 else 1
     
-    return ReportList(
-        items=reports,
+    # Una sola llamada a pydantic-core para toda la página
+    return ReportList.json_response(
+        items=ReportList.items_adapter().validate_python(reports, from_attributes=True),
         total=total,
         page=page,
         page_size=limit
@@ -36,6 +36,7 @@ class Settings(BaseSettings):
     DB_ECHO: bool = False
     DB_POOL_SIZE: int = 10
     DB_MAX_OVERFLOW: int = 20
+    DB_QUERY_CACHE_SIZE: int = 1200
     
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
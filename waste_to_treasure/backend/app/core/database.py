@@ -44,6 +44,7 @@ def create_db_engine():
             max_overflow=settings.DB_MAX_OVERFLOW,
             pool_pre_ping=True,
             pool_recycle=3600, # Recicla conexiones cada hora
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE, # Cache de SQL compilado (LRU)
         )
         logger.info("Engine de base de datos creado exitosamente.")
         return engine
@@ -89,6 +90,7 @@ async_engine = create_async_engine(
     echo=settings.DB_ECHO,
     poolclass=NullPool,  # NullPool es compatible con async
     pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
 )
 logger.info("Async engine de base de datos creado exitosamente.")
 
@@ -17,7 +17,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -76,6 +76,9 @@ app = FastAPI(
     # CRÍTICO: Deshabilitar redirects para evitar exposición de IP interna
     # Los routers deben definir rutas sin trailing slash
     redirect_slashes=False,
+    # orjson para renderizar las respuestas que FastAPI arma desde response_model
+    # (los *List ya devuelven bytes de TypeAdapter.dump_json)
+    default_response_class=ORJSONResponse,
 )
 
 
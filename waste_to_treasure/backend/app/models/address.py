@@ -7,10 +7,11 @@ Almacena direcciones físicas para usuarios, listings y orders.
 # Autor: Oscar Alonso Nava Rivera
 # Fecha: 04/11/2025
 # Descripción: Modelo SQLAlchemy para direcciones (Address). Almacena direcciones físicas para usuarios, listings y orders y contiene validaciones y utilidades relacionadas.
+import re
 import uuid
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Integer, Boolean, ForeignKey, CheckConstraint
+from sqlalchemy import String, Integer, Boolean, ForeignKey, CheckConstraint, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -20,6 +21,15 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
+# Formatos de código postal por país, compilados una sola vez al importar
+_POSTAL_CODE_PATTERNS = {
+    "MX": re.compile(r"^\d{5}$"),                 # México: 5 dígitos (ej: 32500)
+    "US": re.compile(r"^\d{5}(-\d{4})?$"),        # USA: 12345 o 12345-6789
+    "CA": re.compile(r"^[A-Z]\d[A-Z] \d[A-Z]\d$"),  # Canadá: A1A 1A1
+}
+_POSTAL_CODE_FALLBACK = re.compile(r"^.{4,20}$")  # Fallback genérico
+
+
 class Address(BaseModel):
     """
     Modelo de dirección física.
@@ -125,6 +135,11 @@ class Address(BaseModel):
             "country ~ '^[A-Z]{2}$'",
             name="ck_address_country_iso_format"
         ),
+        # Libreta de direcciones: default primero, luego más recientes
+        Index(
+            "ix_addresses_user_default",
+            "user_id", text("is_default DESC"), text("created_at DESC"),
+        ),
     )
     
     # MÉTODOS DE INSTANCIA
@@ -161,16 +176,8 @@ class Address(BaseModel):
             Implementación básica. Expandir según países soportados.
             Actualmente valida: MX (México), US (Estados Unidos).
         """
-        import re
-        
-        patterns = {
-            "MX": r"^\d{5}$",                # México: 5 dígitos (ej: 32500)
-            "US": r"^\d{5}(-\d{4})?$",       # USA: 12345 o 12345-6789
-            "CA": r"^[A-Z]\d[A-Z] \d[A-Z]\d$" # Canadá: A1A 1A1
-        }
-        
-        pattern = patterns.get(self.country, r"^.{4,20}$")  # Fallback genérico
-        return bool(re.match(pattern, self.postal_code))
+        pattern = _POSTAL_CODE_PATTERNS.get(self.country, _POSTAL_CODE_FALLBACK)
+        return bool(pattern.match(self.postal_code))
     
     def get_short_address(self) -> str:
         """
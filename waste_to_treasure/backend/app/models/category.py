@@ -9,8 +9,8 @@ Almacena la jerarquía de categorías para productos y materiales.
 # Descripción: Modelos de datos para Category con métodos de jerarquía.
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, Integer, ForeignKey, Enum as SQLEnum, Index
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Integer, ForeignKey, Enum as SQLEnum, Index, event, func, select, update
+from sqlalchemy.orm import Mapped, mapped_column, relationship, attributes, object_session
 import enum
 
 from app.models.base import BaseModel
@@ -32,6 +32,13 @@ class ListingTypeEnum(str, enum.Enum):
     MATERIAL = "MATERIAL"
     PRODUCT = "PRODUCT"
 
+# Tipo de columna compartido por Category.type y Listing.listing_type
+# (mismo ENUM de Postgres); se construye una sola vez.
+LISTING_TYPE_SQL_ENUM = SQLEnum(ListingTypeEnum, name="listing_type_enum", create_constraint=True)
+
+# Longitud de la columna full_path; las rutas más largas se rechazan
+FULL_PATH_MAX_LENGTH = 512
+
 class Category(BaseModel):
     """
     Autor: Oscar Alonso Nava Rivera
@@ -73,7 +80,7 @@ class Category(BaseModel):
         comment="Identificador único legible en URLs"
     )
     type: Mapped[ListingTypeEnum] = mapped_column(
-        SQLEnum(ListingTypeEnum, name="listing_type_enum", create_constraint=True),
+        LISTING_TYPE_SQL_ENUM,
         nullable=False,
         index=True,
         comment="Tipo de categoría: MATERIAL o PRODUCT"
@@ -86,6 +93,12 @@ class Category(BaseModel):
         nullable=True,
         comment="ID de categoría padre para jerarquías"
     )
+    # Ruta desnormalizada, mantenida por los eventos before_insert/before_update
+    full_path: Mapped[str] = mapped_column(
+        String(FULL_PATH_MAX_LENGTH),
+        nullable=False,
+        comment="Ruta completa en la jerarquía (ej: 'Madera > Madera Reciclada')"
+    )
     
     # RELACIONES
     parent: Mapped[Optional["Category"]] = relationship(
@@ -109,6 +122,12 @@ class Category(BaseModel):
     __table_args__ = (
         Index("ix_categories_type_parent", "type", "parent_category_id"),
         Index("ix_categories_name_type", "name", "type", unique=True),
+        # varchar_pattern_ops: permite usar el índice en LIKE 'Madera >%'
+        Index(
+            "ix_categories_full_path",
+            "full_path",
+            postgresql_ops={"full_path": "varchar_pattern_ops"}
+        ),
     )
 
     # MÉTODOS DE INSTANCIA
@@ -120,6 +139,8 @@ class Category(BaseModel):
         Returns:
             Ruta completa como string, e.g. "Electrónica > Móviles > Smartphones"
         """
+        if self.full_path:
+            return self.full_path
         if self.parent:
             return f"{self.parent.get_full_path()} > {self.name}"
         return self.name
@@ -158,3 +179,116 @@ class Category(BaseModel):
             f"name={self.name!r}, slug={self.slug!r}, "
             f"type={self.type.value!r}, parent_id={self.parent_category_id!r})"
         )
+
+
+# MANTENIMIENTO DE full_path
+PATH_SEPARATOR = " > "
+
+
+def _parent_path(connection, target: Category) -> Optional[str]:
+    """
+    Obtiene la ruta del padre de `target`, sin lazy loading.
+
+    Usa el padre en memoria si la relación ya está cargada y corresponde a
+    `parent_category_id` (al cambiar solo la FK, la relación cargada sigue
+    apuntando al padre anterior); si no, lo lee con la misma conexión del
+    flush.
+    """
+    if target.parent_category_id is None:
+        return None
+    parent = target.__dict__.get("parent")
+    if (
+        parent is not None
+        and parent.category_id == target.parent_category_id
+        and parent.full_path
+    ):
+        return parent.full_path
+    return connection.scalar(
+        select(Category.full_path).where(Category.category_id == target.parent_category_id)
+    )
+
+
+def _build_full_path(connection, target: Category) -> str:
+    """
+    Arma la ruta de `target` a partir de la de su padre.
+
+    Raises:
+        ValueError: Si la ruta no cabe en la columna full_path.
+    """
+    parent_path = _parent_path(connection, target)
+    full_path = f"{parent_path}{PATH_SEPARATOR}{target.name}" if parent_path else target.name
+    if len(full_path) > FULL_PATH_MAX_LENGTH:
+        raise ValueError(
+            f"La ruta de la categoría excede {FULL_PATH_MAX_LENGTH} caracteres"
+        )
+    return full_path
+
+
+@event.listens_for(Category, "before_insert")
+def _set_full_path_on_insert(mapper, connection, target: Category) -> None:
+    target.full_path = _build_full_path(connection, target)
+
+
+@event.listens_for(Category, "before_update")
+def _set_full_path_on_update(mapper, connection, target: Category) -> None:
+    state = attributes.instance_state(target)
+    if not any(
+        state.attrs[key].history.has_changes()
+        for key in ("name", "parent_category_id")
+    ):
+        return
+    target.full_path = _build_full_path(connection, target)
+
+
+@event.listens_for(Category, "after_update")
+def _cascade_full_path(mapper, connection, target: Category) -> None:
+    """
+    Reescribe el prefijo de la ruta de todos los descendientes en un solo
+    UPDATE (CTE recursivo) cuando cambia la ruta de `target`.
+
+    El UPDATE no pasa por el ORM, así que las rutas devueltas se copian a
+    los descendientes que ya estén cargados en la sesión (la sesión usa
+    `expire_on_commit=False` y de otro modo conservarían la ruta vieja).
+
+    Raises:
+        ValueError: Si la ruta de algún descendiente excedería la columna.
+    """
+    history = attributes.instance_state(target).attrs.full_path.history
+    if not history.deleted or not history.deleted[0]:
+        return
+    old_path = history.deleted[0]
+    if old_path == target.full_path:
+        return
+
+    descendants = (
+        select(Category.category_id)
+        .where(Category.parent_category_id == target.category_id)
+        .cte("descendants", recursive=True)
+    )
+    descendants = descendants.union_all(
+        select(Category.category_id)
+        .where(Category.parent_category_id == descendants.c.category_id)
+    )
+    in_subtree = Category.category_id.in_(select(descendants.c.category_id))
+
+    longest = connection.scalar(select(func.max(func.length(Category.full_path))).where(in_subtree))
+    if longest and longest - len(old_path) + len(target.full_path) > FULL_PATH_MAX_LENGTH:
+        raise ValueError(
+            f"La ruta de una subcategoría excedería {FULL_PATH_MAX_LENGTH} caracteres"
+        )
+
+    rows = connection.execute(
+        update(Category)
+        .where(in_subtree)
+        .values(full_path=target.full_path + func.substr(Category.full_path, len(old_path) + 1))
+        .returning(Category.category_id, Category.full_path)
+        .execution_options(synchronize_session=False)
+    )
+
+    session = object_session(target)
+    if session is None:
+        return
+    for category_id, full_path in rows:
+        loaded = session.identity_map.get(mapper.identity_key_from_primary_key((category_id,)))
+        if loaded is not None and "full_path" in loaded.__dict__:
+            attributes.set_committed_value(loaded, "full_path", full_path)
@@ -20,7 +20,7 @@ from sqlalchemy.dialects.postgresql import UUID
 import enum
 
 from app.models.base import BaseModel
-from app.models.category import ListingTypeEnum
+from app.models.category import ListingTypeEnum, LISTING_TYPE_SQL_ENUM
 
 if TYPE_CHECKING:
     from app.models.category import Category
@@ -112,7 +112,7 @@ class Listing(BaseModel):
     )
     
     listing_type: Mapped[ListingTypeEnum] = mapped_column(
-        SQLEnum(ListingTypeEnum, name="listing_type_enum", create_constraint=False),
+        LISTING_TYPE_SQL_ENUM,
         nullable=False,
         index=True,
         comment="Tipo de publicación: MATERIAL (B2B) o PRODUCT (B2C)"
@@ -16,7 +16,7 @@ Cada notificación tiene un tipo, contenido, prioridad, estado de lectura y URL
 import uuid
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, Index
+from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -47,7 +47,8 @@ class Notification(BaseModel):
     Database Constraints:
         - user_id debe existir en users.
         - Índices en user_id e is_read para queries eficientes.
-        - Índice compuesto en (user_id, is_read) para filtros comunes.
+        - Índice compuesto en (user_id, is_read, created_at DESC) que cubre
+          el listado paginado (no leídas primero, más recientes primero).
     """
     __tablename__ = "notifications"
     
@@ -109,7 +110,12 @@ class Notification(BaseModel):
     
     # INDICES COMPUESTOS
     __table_args__ = (
-        Index("ix_notifications_user_read", "user_id", "is_read"),
+        # Sigue el ORDER BY de NotificationService.get_user_notifications,
+        # así Postgres lee en orden del índice en lugar de ordenar.
+        Index(
+            "ix_notifications_user_read_created",
+            "user_id", "is_read", text("created_at DESC"),
+        ),
         Index("ix_notifications_user_created", "user_id", "created_at"),
     )
     
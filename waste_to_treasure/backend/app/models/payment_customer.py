@@ -16,10 +16,9 @@ from typing import TYPE_CHECKING, Optional
 from sqlalchemy import String, Integer, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import Enum as SQLEnum
 
 from app.models.base import BaseModel
-from app.models.payment_enums import PaymentGatewayEnum
+from app.models.payment_enums import PaymentGatewayEnum, PAYMENT_GATEWAY_SQL_ENUM
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -69,7 +68,7 @@ class PaymentCustomer(BaseModel):
     )
     
     gateway: Mapped[PaymentGatewayEnum] = mapped_column(
-        SQLEnum(PaymentGatewayEnum, name="payment_gateway_enum", create_constraint=True),
+        PAYMENT_GATEWAY_SQL_ENUM,
         nullable=False,
         comment="Pasarela de pago: STRIPE o PAYPAL"
     )
@@ -10,6 +10,8 @@ Descripción: Enums de pagos (gateway, estado, payout, etc.).
 """
 import enum
 
+from sqlalchemy import Enum as SQLEnum
+
 class PaymentGatewayEnum(str, enum.Enum):
     """
     Enum para las pasarelas de pago soportadas.
@@ -20,6 +22,10 @@ class PaymentGatewayEnum(str, enum.Enum):
     STRIPE = "STRIPE"
     PAYPAL = "PAYPAL"
 
+# Tipo de columna compartido por PaymentCustomer.gateway y
+# PaymentTransaction.gateway (mismo ENUM de Postgres).
+PAYMENT_GATEWAY_SQL_ENUM = SQLEnum(PaymentGatewayEnum, name="payment_gateway_enum", create_constraint=True)
+
 class PaymentStatusEnum(str, enum.Enum):
     """
     Enum para el estado de una transacción de pago.
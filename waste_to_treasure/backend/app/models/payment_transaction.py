@@ -19,7 +19,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import Enum as SQLEnum
 
 from app.models.base import BaseModel
-from app.models.payment_enums import PaymentGatewayEnum, PaymentStatusEnum
+from app.models.payment_enums import PaymentGatewayEnum, PaymentStatusEnum, PAYMENT_GATEWAY_SQL_ENUM
 
 if TYPE_CHECKING:
     from app.models.order import Order
@@ -27,6 +27,18 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 
+# Grupos de estados precalculados: la pertenencia se resuelve con un lookup
+# en un frozenset en lugar de construir una lista en cada llamada.
+_PENDING_STATES = frozenset({
+    PaymentStatusEnum.PENDING,
+    PaymentStatusEnum.PROCESSING,
+})
+_FAILED_STATES = frozenset({
+    PaymentStatusEnum.FAILED,
+    PaymentStatusEnum.CANCELLED,
+})
+
+
 class PaymentTransaction(BaseModel):
     """
     Modelo de transacción de pago.
@@ -81,7 +93,7 @@ class PaymentTransaction(BaseModel):
     
     # INFORMACIÓN DE LA PASARELA
     gateway: Mapped[PaymentGatewayEnum] = mapped_column(
-        SQLEnum(PaymentGatewayEnum, name="payment_gateway_enum", create_constraint=True),
+        PAYMENT_GATEWAY_SQL_ENUM,
         nullable=False,
         index=True,
         comment="Pasarela de pago utilizada: STRIPE o PAYPAL"
@@ -223,10 +235,7 @@ class PaymentTransaction(BaseModel):
         Returns:
             True si el status es PENDING o PROCESSING.
         """
-        return self.status in [
-            PaymentStatusEnum.PENDING,
-            PaymentStatusEnum.PROCESSING
-        ]
+        return self.status in _PENDING_STATES
     
     def is_failed(self) -> bool:
         """
@@ -235,10 +244,7 @@ class PaymentTransaction(BaseModel):
         Returns:
             True si el status es FAILED o CANCELLED.
         """
-        return self.status in [
-            PaymentStatusEnum.FAILED,
-            PaymentStatusEnum.CANCELLED
-        ]
+        return self.status in _FAILED_STATES
     
     def can_be_refunded(self) -> bool:
         """
@@ -10,7 +10,7 @@ Implementa la tabla 'reports'
 import uuid
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlalchemy import func, String, Integer, ForeignKey, DateTime, Text, Enum, text
+from sqlalchemy import func, String, Integer, ForeignKey, DateTime, Text, Enum, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.models.base import BaseModel
@@ -140,6 +140,20 @@ class Report(BaseModel):
     reported_order = relationship("Order",back_populates="reports")
     resolved_by_admin = relationship("User",foreign_keys=[resolved_by_admin_id],back_populates="reports_resolved")
     
+    # INDICES
+    # Cada reporte apunta a una sola entidad, por lo que las otras dos FKs
+    # siempre son NULL. Los índices parciales solo guardan las filas que
+    # usan la columna: búsquedas por entidad y ON DELETE CASCADE desde
+    # listings/orders resuelven con un index scan sin indexar los NULL.
+    __table_args__ = (
+        Index("ix_reports_reported_listing", "reported_listing_id",
+              postgresql_where="reported_listing_id IS NOT NULL"),
+        Index("ix_reports_reported_user", "reported_user_id",
+              postgresql_where="reported_user_id IS NOT NULL"),
+        Index("ix_reports_reported_order", "reported_order_id",
+              postgresql_where="reported_order_id IS NOT NULL"),
+    )
+    
     def __repr__(self) -> str:
         return (
             f"Report(report_id={self.report_id!r}, "
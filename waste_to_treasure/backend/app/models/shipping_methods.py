@@ -8,24 +8,32 @@ Implementa la tabla 'shipping_methods' que permite a los vendedores definir sus
 ya sea para recojo en tienda o para envío a domicilio. Cada vendedor puede crear múltiples métodos de envío.
 """
 import uuid
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Optional, List
 import enum
 from sqlalchemy import (
     Integer,
     String,
     Numeric,
-    Enum as SQLEnum,
+    CheckConstraint,
     ForeignKey,
+    cast,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.models.base import BaseModel
+from app.models.types import CharEnum
 
 if TYPE_CHECKING:
     from app.models.user import User
     from app.models.listing_shipping_options import ListingShippingOption
 
+# Tope de cost_cents (columna INTEGER de Postgres): 21,474,836.47 pesos
+MAX_COST_CENTS = 2**31 - 1
+MAX_COST = Decimal(MAX_COST_CENTS).scaleb(-2)
+
 
 class ShippingTypeEnum(str, enum.Enum):
     """
@@ -50,6 +58,9 @@ class ShippingMethod(BaseModel):
         seller: El usuario (vendedor) que ofrece este método de envío.
     """
     __tablename__ = "shipping_methods"
+    __table_args__ = (
+        CheckConstraint("type IN ('P', 'D')", name="ck_shipping_methods_type"),
+    )
 
     method_id: Mapped[int] = mapped_column(
         Integer,
@@ -61,6 +72,7 @@ class ShippingMethod(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("users.user_id"),
         nullable=False,
+        index=True,
         comment="UUID del vendedor que ofrece este método."
     )
     name: Mapped[str] = mapped_column(
@@ -68,20 +80,51 @@ class ShippingMethod(BaseModel):
         nullable=False,
         comment="Nombre descriptivo (ej. 'Recojo en taller')."
     )
-    cost: Mapped[float] = mapped_column(
-        Numeric(10, 2),
+    cost_cents: Mapped[int] = mapped_column(
+        Integer,
         nullable=False,
-        default=0.0,
-        comment="El precio que será agregado a la orden si este método es escogido."
+        default=0,
+        comment="El precio (en centavos) que será agregado a la orden si este método es escogido."
     )
     type: Mapped[ShippingTypeEnum] = mapped_column(
-        SQLEnum(ShippingTypeEnum, name="shipping_type_enum", create_constraint=True),
+        CharEnum(ShippingTypeEnum),
         nullable=False,
         default=ShippingTypeEnum.DELIVERY,
-        comment="Define si es para recojo ('pickup') o para envío a casa ('delivery')."
+        comment="Define si es para recojo ('P') o para envío a casa ('D')."
     )
 
+    @hybrid_property
+    def cost(self) -> Optional[Decimal]:
+        """Costo en pesos; se almacena como entero en `cost_cents`."""
+        if self.cost_cents is None:
+            return None
+        return Decimal(self.cost_cents).scaleb(-2)
+
+    @cost.inplace.setter
+    def _cost_setter(self, value: Decimal) -> None:
+        # cost_cents es NOT NULL: None o un valor no numérico se rechazan aquí
+        # con un mensaje claro en lugar de un InvalidOperation de decimal
+        if value is None:
+            raise ValueError("El costo del método de envío es obligatorio")
+        try:
+            cost = Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError(f"Costo de envío inválido: {value!r}") from None
+        if not cost.is_finite():
+            raise ValueError(f"Costo de envío inválido: {value!r}")
+        cents = int((cost * 100).to_integral_value(ROUND_HALF_UP))
+        if not 0 <= cents <= MAX_COST_CENTS:
+            raise ValueError(f"El costo de envío debe estar entre 0 y {MAX_COST}")
+        self.cost_cents = cents
+
+    @cost.inplace.expression
+    @classmethod
+    def _cost_expression(cls):
+        return cast(cls.cost_cents, Numeric(10, 2)) / 100
+
     # RELACIONES
+    # Many-to-one: con un JOIN explícito a users usar
+    # contains_eager(ShippingMethod.seller), no joinedload (JOIN duplicado).
     seller: Mapped["User"] = relationship(
         "User"
     )
@@ -91,8 +134,8 @@ class ShippingMethod(BaseModel):
     )
 
     def __repr__(self) -> str:
-        """Representación legible del modelo."""
+        """Representación corta para logs; el estado completo está en to_dict()."""
         return (
             f"<ShippingMethod(method_id={self.method_id}, name='{self.name}', "
-            f"type='{self.type.value}', cost={self.cost}, seller_id={self.seller_id})>"
+            f"type={getattr(self.type, 'name', None)}, cost_cents={self.cost_cents})>"
         )
\ No newline at end of file
@@ -18,7 +18,8 @@ from sqlalchemy import (
     Integer, 
     ForeignKey, 
     DateTime, 
-    Enum as SQLAlchemyEnum,
+    CheckConstraint,
+    Index,
     UniqueConstraint
 )
 
@@ -26,6 +27,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.models.base import BaseModel
+from app.models.types import CharEnum
 
 if TYPE_CHECKING:
     from app.models.payment_transaction import PaymentTransaction
@@ -48,6 +50,17 @@ class Subscription(BaseModel):
     __tablename__ = "subscriptions"
     __table_args__ = (
         UniqueConstraint('user_id', 'plan_id', name='unique_user_plan'),
+        # Suscripción activa de un usuario (get_active_subscription)
+        Index("ix_subscriptions_user_status", "user_id", "status"),
+        CheckConstraint("status IN ('A', 'I', 'C')", name="ck_subscriptions_status"),
+        # Para el cobro de renovaciones (activas con next_billing_date
+        # vencida): solo suscripciones activas, el índice no crece con las
+        # canceladas/inactivas.
+        Index(
+            "ix_subscriptions_due",
+            "next_billing_date",
+            postgresql_where="status = 'A'",
+        ),
     )
 
     # COLUMNAS PRINICIPALES
@@ -72,15 +85,11 @@ class Subscription(BaseModel):
         comment='Llave foranea a la tabla de planes (plans)'
     )
     status: Mapped[SubscriptionStatus] = mapped_column(
-        SQLAlchemyEnum(
-            SubscriptionStatus,
-            name="subscription_status_enum",
-            create_constraint=True
-        ),
+        CharEnum(SubscriptionStatus),
         nullable=False,
         default=SubscriptionStatus.ACTIVE,
         index=True,
-        comment="Estatus actual de la suscripcion (e.g., ACTIVE, INACTIVE, CANCELLED)."
+        comment="Estatus actual de la suscripcion (A=ACTIVE, I=INACTIVE, C=CANCELLED)."
     )
     start_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -101,8 +110,13 @@ class Subscription(BaseModel):
     )
 
     # RELATIONSHIPS
+    # Many-to-one: si la consulta ya hace JOIN a users (p. ej. para filtrar),
+    # hidratarla con contains_eager(Subscription.user) en lugar de
+    # joinedload, que agregaría un segundo JOIN a la misma tabla.
     user = relationship("User", back_populates="subscriptions")
-    plan = relationship("Plan", back_populates="subscriptions")
+    # El plan siempre se serializa anidado (SubscriptionRead.plan): se carga
+    # en el mismo SELECT con un JOIN en lugar de una segunda consulta.
+    plan = relationship("Plan", back_populates="subscriptions", lazy="joined")
     
     payment_transactions: Mapped[List["PaymentTransaction"]] = relationship(
         "PaymentTransaction",
@@ -111,13 +125,9 @@ class Subscription(BaseModel):
     )
 
     def __repr__(self) -> str:
+        """Representación corta para logs; el estado completo está en to_dict()."""
         return (
-            f"<Subscription(subscription_id={self.subscription_id!r}, "
-            f"user_id={self.user_id!r}, "
-            f"plan_id={self.plan_id!r}, "
-            f"status={self.status!r}, "
-            f"start_date={self.start_date!r}, "
-            f"next_billing_date={self.next_billing_date!r}, "
-            f"gateway_sub_id={self.gateway_sub_id!r})>"
+            f"<Subscription(subscription_id={self.subscription_id}, "
+            f"plan_id={self.plan_id}, status={getattr(self.status, 'name', None)})>"
         )
 
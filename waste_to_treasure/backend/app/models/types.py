@@ -0,0 +1,61 @@
+"""
+Tipos de columna personalizados para SQLAlchemy.
+
+Autor: Oscar Alonso Nava Rivera
+Descripción: TypeDecorators compartidos por los modelos.
+"""
+import enum
+from typing import Optional, Type
+
+from sqlalchemy import CHAR
+from sqlalchemy.types import TypeDecorator
+
+
+class CharEnum(TypeDecorator):
+    """
+    Guarda un enum de Python como CHAR(1) usando la inicial del miembro.
+
+    Descripción: Alternativa a los ENUM nativos de Postgres para columnas
+    de estado que se leen en cada fila: el valor se decodifica como texto
+    plano y agregar un estado solo requiere cambiar el CHECK constraint.
+
+    Example:
+        >>> CharEnum(UserStatusEnum)  # PENDING -> 'P', ACTIVE -> 'A', ...
+
+    Note:
+        Las iniciales deben ser únicas dentro del enum. La columna debe
+        declarar su propio CheckConstraint con los códigos válidos.
+    """
+    impl = CHAR(1)
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[enum.Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._by_code = {member.name[0]: member for member in enum_class}
+        if len(self._by_code) != len(enum_class):
+            raise ValueError(f"{enum_class.__name__}: las iniciales de los miembros no son únicas")
+
+    def process_bind_param(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_class):
+            try:
+                value = self.enum_class(value)
+            except ValueError:
+                try:
+                    value = self.enum_class[value]
+                except KeyError:
+                    # ValueError y no KeyError: SQLAlchemy la envuelve en
+                    # StatementError con un mensaje que dice qué se esperaba.
+                    allowed = ", ".join(member.name for member in self.enum_class)
+                    raise ValueError(
+                        f"{value!r} no es un {self.enum_class.__name__} válido; "
+                        f"valores permitidos: {allowed}"
+                    ) from None
+        return value.name[0]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._by_code[value]
@@ -9,12 +9,14 @@ Almacena la información de los usuarios de la plataforma.
 # Descripción: Modelos de datos para usuarios y enums relacionados
 import uuid
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Integer, Enum as SQLEnum
+from sqlalchemy import String, Integer, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 
 from app.models.base import BaseModel
+from app.models.types import CharEnum
+from app.utils.ids import uuid7
 
 if TYPE_CHECKING:
     from app.models.listing import Listing
@@ -58,11 +60,18 @@ class User(BaseModel):
     """
     # Autor: Oscar Alonso Nava Rivera
     __tablename__ = "users"
+    __table_args__ = (
+        CheckConstraint("role IN ('U', 'A')", name="ck_users_role"),
+        CheckConstraint("status IN ('P', 'A', 'B')", name="ck_users_status"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        # En producción el valor siempre es el 'sub' de Cognito; el default
+        # solo aplica a usuarios creados localmente (seeds, scripts) y usa
+        # UUIDv7 para que esas inserciones sean monotónicas en el índice.
+        default=uuid7,
         comment="UUID del usuario (cognito sub claim)"
     )
     # --- CAMBIO: Campo 'cognito_sub' ELIMINADO ---
@@ -97,26 +106,31 @@ class User(BaseModel):
         comment="Biografía del vendedor - información pública sobre el negocio"
     )
     role: Mapped[UserRoleEnum] = mapped_column(
-        SQLEnum(UserRoleEnum, name="user_role_enum", create_constraint=True),
+        CharEnum(UserRoleEnum),
         nullable=False,
         default=UserRoleEnum.USER,
-        comment="Rol del usuario en la plataforma"
+        comment="Rol del usuario en la plataforma (U=USER, A=ADMIN)"
     )
     status: Mapped[UserStatusEnum] = mapped_column(
-        SQLEnum(UserStatusEnum, name="user_status_enum", create_constraint=True),
+        CharEnum(UserStatusEnum),
         nullable=False,
         default=UserStatusEnum.PENDING,
-        comment="Estado actual del usuario"
+        comment="Estado actual del usuario (P=PENDING, A=ACTIVE, B=BLOCKED)"
     )
 
     # RELACIONES
+    #
+    # passive_deletes=True en las colecciones cuya FK es ON DELETE CASCADE:
+    # al borrar un usuario Postgres elimina los hijos y SQLAlchemy no carga
+    # cada colección para borrarla fila por fila.
     
     # Como vendedor: publicaciones creadas por este usuario
     listings: Mapped[List["Listing"]] = relationship(
         "Listing",
         foreign_keys="Listing.seller_id",
         back_populates="seller",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     # Como comprador: órdenes realizadas por este usuario
@@ -153,14 +167,16 @@ class User(BaseModel):
         "Cart",
         back_populates="owner",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     # Direcciones del usuario (address book)
     addresses: Mapped[List["Address"]] = relationship(
         "Address",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     # Reportes realizados por este usuario
@@ -189,7 +205,8 @@ class User(BaseModel):
         "Offer",
         foreign_keys="Offer.buyer_id",
         back_populates="buyer",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     # Relación con ofertas recibidas (como vendedor)
@@ -197,7 +214,8 @@ class User(BaseModel):
         "Offer",
         foreign_keys="Offer.seller_id",
         back_populates="seller",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     # Relación con Notifications
@@ -205,6 +223,7 @@ class User(BaseModel):
         "Notification",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="Notification.created_at.desc()"
     )
     
@@ -219,23 +238,25 @@ class User(BaseModel):
     subscriptions: Mapped[List["Subscription"]] = relationship(
         "Subscription",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     # Relación con PaymentCustomers (Stripe/PayPal customer IDs)
     payment_customers: Mapped[List["PaymentCustomer"]] = relationship(
         "PaymentCustomer",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     def __repr__(self) -> str:
         """
         Autor: Oscar Alonso Nava Rivera
         Representación legible del modelo de usuario para debugging.
+        El estado completo está en to_dict().
         """
         return (
-            f"User(user_id={self.user_id!r}, email={self.email!r}, "
-            f"full_name={self.full_name!r}, role={self.role.value!r}, "
-            f"status={self.status.value!r})"
+            f"User(user_id={self.user_id}, email={self.email!r}, "
+            f"role={getattr(self.role, 'name', None)}, status={getattr(self.status, 'name', None)})"
         )
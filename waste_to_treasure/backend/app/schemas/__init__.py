@@ -6,87 +6,114 @@ Autor: Oscar Alonso Nava Rivera
 Fecha: 31/10/2025
 Descripción: Exporta schemas Pydantic usados por la API.
 """
-from app.schemas.category import (
-    CategoryBase,
-    CategoryCreate,
-    CategoryUpdate,
-    CategoryInDB,
-    CategoryRead,
-    Category,
-    CategoryWithChildren,
-    CategoryList,
-    CategoryTree,
-)
-from app.schemas.address import(
-    AddressBase,
-    AddressCreate,
-    AddressInDB,
-    AddressRead,
-    AddressList,
-    AddressWithUser,
-    UserBasic,
-)
-from app.schemas.user import (
-    UserRead,
-    UserPublic,
-    UserUpdate,
-    UserAdminUpdate,
-)
-from app.schemas.payment import (
-    PaymentTransactionBase,
-    PaymentTransactionCreate,
-    PaymentTransactionUpdate,
-    PaymentTransactionInDB,
-    PaymentTransactionRead,
-    PaymentTransactionList,
-    PaymentTransactionPublic,
-)
-from app.schemas.checkout import (
-    CheckoutLineItem,
-    CheckoutRequest,
-    CheckoutSessionResponse,
-    PaymentIntentRequest,
-    PaymentIntentResponse,
-    PaymentConfirmation,
-    PaymentError,
-)
-from app.schemas.payment_customer import (
-    PaymentCustomerBase,
-    PaymentCustomerCreate,
-    PaymentCustomerUpdate,
-    PaymentCustomerInDB,
-    PaymentCustomerRead,
-    PaymentMethodCreate,
-    PaymentMethodRead,
-    PaymentMethodList,
-)
-from app.schemas.seller_payment_account import (
-    SellerPaymentAccountBase,
-    SellerPaymentAccountCreate,
-    SellerPaymentAccountUpdate,
-    SellerPaymentAccountInDB,
-    SellerPaymentAccountRead,
-    SellerPaymentAccountList,
-    SellerPaymentAccountAdmin,
-)
-from app.schemas.payout import (
-    PayoutBase,
-    PayoutCreate,
-    PayoutApprove,
-    PayoutReject,
-    PayoutInDB,
-    PayoutRead,
-    PayoutList,
-    PayoutStats,
-)
-from app.schemas.webhook import (
-    StripeWebhookEvent,
-    WebhookProcessingResult,
-    WebhookResponse,
-    PayPalWebhookEvent,
-    RefundRequest,
-    RefundResponse,
-)
+import importlib
+from typing import Any
+
+# Los submódulos se importan bajo demanda (PEP 562): importar un schema
+# concreto (p. ej. app.schemas.faq) ya no construye los ~60 modelos
+# Pydantic del resto de módulos.
+_SUBMODULE_EXPORTS = {
+    "app.schemas.category": (
+        "CategoryBase",
+        "CategoryCreate",
+        "CategoryUpdate",
+        "CategoryInDB",
+        "CategoryRead",
+        "Category",
+        "CategoryWithChildren",
+        "CategoryNode",
+        "CategoryList",
+        "CategoryTree",
+    ),
+    "app.schemas.address": (
+        "AddressBase",
+        "AddressCreate",
+        "AddressUpdate",
+        "AddressInDB",
+        "AddressRead",
+        "AddressList",
+        "AddressWithUser",
+        "UserBasic",
+    ),
+    "app.schemas.user": (
+        "UserRead",
+        "UserPublic",
+        "UserUpdate",
+        "UserAdminUpdate",
+    ),
+    "app.schemas.payment": (
+        "PaymentTransactionBase",
+        "PaymentTransactionCreate",
+        "PaymentTransactionUpdate",
+        "PaymentTransactionInDB",
+        "PaymentTransactionRead",
+        "PaymentTransactionList",
+        "PaymentTransactionPublic",
+    ),
+    "app.schemas.checkout": (
+        "CheckoutLineItem",
+        "CheckoutRequest",
+        "CheckoutSessionResponse",
+        "PaymentIntentRequest",
+        "PaymentIntentResponse",
+        "PaymentConfirmation",
+        "PaymentError",
+    ),
+    "app.schemas.payment_customer": (
+        "PaymentCustomerBase",
+        "PaymentCustomerCreate",
+        "PaymentCustomerUpdate",
+        "PaymentCustomerInDB",
+        "PaymentCustomerRead",
+        "PaymentMethodCreate",
+        "PaymentMethodRead",
+        "PaymentMethodList",
+    ),
+    "app.schemas.seller_payment_account": (
+        "SellerPaymentAccountBase",
+        "SellerPaymentAccountCreate",
+        "SellerPaymentAccountUpdate",
+        "SellerPaymentAccountInDB",
+        "SellerPaymentAccountRead",
+        "SellerPaymentAccountList",
+        "SellerPaymentAccountAdmin",
+    ),
+    "app.schemas.payout": (
+        "PayoutBase",
+        "PayoutCreate",
+        "PayoutApprove",
+        "PayoutReject",
+        "PayoutInDB",
+        "PayoutRead",
+        "PayoutList",
+        "PayoutStats",
+    ),
+    "app.schemas.webhook": (
+        "StripeWebhookEvent",
+        "WebhookProcessingResult",
+        "WebhookResponse",
+        "PayPalWebhookEvent",
+        "RefundRequest",
+        "RefundResponse",
+    ),
+}
+
+_LAZY = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Importa el submódulo que define `name` en el primer acceso y lo cachea."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # category schemas
@@ -97,6 +124,7 @@ __all__ = [
     "CategoryRead",
     "Category",
     "CategoryWithChildren",
+    "CategoryNode",
     "CategoryList",
     "CategoryTree",
 
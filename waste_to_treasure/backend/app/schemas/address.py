@@ -8,10 +8,22 @@ Autor: Oscar Alonso Nava Rivera
 Fecha: 06/11/2025
 Descripción: Pydantic schemas para Address (validaciones y DTOs)
 """
-from typing import Optional
+from typing import Annotated, Optional
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints
+
+from app.schemas.base import ORMSchema, PaginatedBase, PaginatedListMixin, TrustedReadMixin
+
+# Tipos con restricciones compartidos por AddressBase y AddressUpdate
+StreetStr = Annotated[str, StringConstraints(min_length=5, max_length=255)]
+CityStr = Annotated[str, StringConstraints(min_length=2, max_length=100)]
+StateStr = Annotated[str, StringConstraints(min_length=2, max_length=100)]
+PostalStr = Annotated[str, StringConstraints(min_length=4, max_length=20)]
+NotesStr = Annotated[str, StringConstraints(max_length=500)]
+# Código ISO 3166-1 alpha-2; pydantic-core lo normaliza a mayúsculas ("mx" -> "MX").
+CountryCode = Annotated[str, StringConstraints(to_upper=True, min_length=2, max_length=2)]
+
 
 class AddressBase(BaseModel):
     """
@@ -19,44 +31,33 @@ class AddressBase(BaseModel):
 
     contiene los campos que se usan tanto en creación como actualización.
     """
-    street: str = Field(
+    street: StreetStr = Field(
         ...,
-        min_length=5,
-        max_length=255,
         description="Calle y número",
         examples=["Av. Tecnológico 1340"]
     )
-    city: str = Field(
+    city: CityStr = Field(
         ...,
-        min_length=2,
-        max_length=100,
         description="Ciudad o municipio",
         examples=["Ciudad Juárez", "Chihuahua"]
     )
-    state: str = Field(
+    state: StateStr = Field(
         ...,
-        min_length=2,
-        max_length=100,
         description="Estado, provincia o región",
         examples=["Chihuahua", "Jalisco", "CDMX"]
     )
-    postal_code: str = Field(
+    postal_code: PostalStr = Field(
         ...,
-        min_length=4,
-        max_length=20,
         description="Código postal",
         examples=["32500", "44100"]
     )
-    country: str = Field(
+    country: CountryCode = Field(
         default="MX",
-        min_length=2,
-        max_length=2,
         description="Código de país ISO 3166-1 alpha-2",
         examples=["MX", "US", "CA"]
     )
-    notes: Optional[str] = Field(
+    notes: Optional[NotesStr] = Field(
         None,
-        max_length=500,
         description="Referencias adicionales o indicaciones de ubicación",
         examples=["Edificio azul, segundo piso", "Casa con portón verde"]
     )
@@ -65,14 +66,7 @@ class AddressBase(BaseModel):
         description="Indica si es la dirección predeterminada del usuario"
     )
 
-    @field_validator("country")
-    @classmethod
-    def validate_country_code(cls, v: str) -> str:
-        """Valida que el código de país esté en mayúsculas."""
-        if not v.isupper():
-            raise ValueError("El código de país debe estar en mayúsculas (ej: MX, US)")
-        return v
-    
+
 class AddressCreate(AddressBase):
     """
     Esquema para crear una nueva dirección.
@@ -96,39 +90,28 @@ class AddressUpdate(BaseModel):
     Usado en: PATCH /api/v1/addresses/{address_id}
     Requiere: Usuario autenticado y ser el owner
     """
-    street: Optional[str] = Field(
+    street: Optional[StreetStr] = Field(
         None,
-        min_length=5,
-        max_length=255,
         description="Calle y número"
     )
-    city: Optional[str] = Field(
+    city: Optional[CityStr] = Field(
         None,
-        min_length=2,
-        max_length=100,
         description="Ciudad o municipio"
     )
-    state: Optional[str] = Field(
+    state: Optional[StateStr] = Field(
         None,
-        min_length=2,
-        max_length=100,
         description="Estado, provincia o región"
     )
-    postal_code: Optional[str] = Field(
+    postal_code: Optional[PostalStr] = Field(
         None,
-        min_length=4,
-        max_length=20,
         description="Código postal"
     )
-    country: Optional[str] = Field(
+    country: Optional[CountryCode] = Field(
         None,
-        min_length=2,
-        max_length=2,
         description="Código de país ISO 3166-1 alpha-2"
     )
-    notes: Optional[str] = Field(
+    notes: Optional[NotesStr] = Field(
         None,
-        max_length=500,
         description="Referencias adicionales"
     )
     is_default: Optional[bool] = Field(
@@ -136,33 +119,18 @@ class AddressUpdate(BaseModel):
         description="Marcar como dirección predeterminada"
     )
 
-    @field_validator("country")
-    @classmethod
-    def validate_country_code(cls, v: Optional[str]) -> Optional[str]:
-        """Valida que el código de país esté en mayúsculas."""
-        if v is not None and not v.isupper():
-            raise ValueError("El código de país debe estar en mayúsculas (ej: MX, US)")
-        return v
-
 
-class AddressInDB(AddressBase):
+class AddressInDB(TrustedReadMixin, ORMSchema, AddressBase):
     """
     Esquema que representa cómo se almacena Address en la base de datos.
     
     Incluye campos autogenerados como ID, user_id y timestamps.
     """
     address_id: int = Field(..., description="Identificador único")
-    user_id: Optional[UUID] = Field(
-        None, 
-        description="UUID del usuario propietario (NULL para direcciones de listings sin usuario)"
-    )
+    # NULL para direcciones de listings sin usuario
+    user_id: Optional[UUID] = None
     created_at: datetime = Field(..., description="Fecha de creación")
     updated_at: datetime = Field(..., description="Última actualización")
-    
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
 
 
 class AddressRead(AddressInDB):
@@ -174,32 +142,25 @@ class AddressRead(AddressInDB):
     
     Usado en: POST, GET, PATCH, DELETE responses
     """
-    pass
+    # DTO de respuesta: inmutable una vez construido
+    model_config = ConfigDict(frozen=True)
 
 
-class AddressList(BaseModel):
+class AddressList(PaginatedListMixin, PaginatedBase[AddressRead]):
     """
     Esquema de respuesta paginada para listar direcciones.
     
     Usado en: GET /api/v1/addresses
     """
-    items: list[AddressRead] = Field(..., description="Lista de direcciones")
-    total: int = Field(..., ge=0, description="Total de direcciones del usuario")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 # Opcional: Si algún endpoint necesita devolver Address con User cargado
-class UserBasic(BaseModel):
+class UserBasic(ORMSchema):
     """Esquema simplificado de User para relaciones."""
     user_id: UUID = Field(..., description="UUID del usuario")
     email: str = Field(..., description="Email del usuario")
     first_name: str = Field(..., description="Nombre del usuario")
     last_name: str = Field(..., description="Apellido del usuario")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 class AddressWithUser(AddressInDB):
@@ -214,7 +175,4 @@ class AddressWithUser(AddressInDB):
         stmt = select(Address).options(selectinload(Address.user))
         ```
     """
-    user: Optional[UserBasic] = Field(
-        None,
-        description="Información básica del usuario propietario"
-    )
\ No newline at end of file
+    user: Optional[UserBasic] = None
\ No newline at end of file
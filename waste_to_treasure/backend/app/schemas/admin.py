@@ -9,12 +9,12 @@ Esquemas de Pydantic para el módulo de Administración.
 Define los contratos de entrada y salida para operaciones de moderación
 y gestión administrativa de la plataforma.
 """
-from typing import Optional, List
+from typing import Annotated, Any, Literal, Optional
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict
 from enum import Enum
-from app.models.user import UserRoleEnum, UserStatusEnum
+from app.schemas.base import ORMSchema, PaginatedBase, PaginatedListMixin, TrustedReadMixin
 
 
 class ModerationStatus(str, Enum):
@@ -32,11 +32,40 @@ class ReportStatus(str, Enum):
     DISMISSED = "dismissed"
 
 
+def _enum_value(value: Any) -> Any:
+    """Convierte un miembro de Enum a su valor; deja pasar los strings."""
+    return value.value if isinstance(value, Enum) else value
+
+
+# Tipos de salida para los estados: Literal con los valores de cada Enum.
+# Se serializan como str sin pasar por el serializer de Enum; los Enum
+# siguen usándose en la capa de BD y en los schemas de request.
+# Los de usuario repiten los valores de app.models.user (UserRoleEnum,
+# UserStatusEnum) en lugar de importarlo: eso cargaría SQLAlchemy, el
+# engine y todos los modelos.
+UserRoleValue = Annotated[
+    Literal["USER", "ADMIN"],  # UserRoleEnum
+    BeforeValidator(_enum_value)
+]
+UserStatusValue = Annotated[
+    Literal["PENDING", "ACTIVE", "BLOCKED"],  # UserStatusEnum
+    BeforeValidator(_enum_value)
+]
+ModerationStatusValue = Annotated[
+    Literal[tuple(member.value for member in ModerationStatus)],
+    BeforeValidator(_enum_value)
+]
+ReportStatusValue = Annotated[
+    Literal[tuple(member.value for member in ReportStatus)],
+    BeforeValidator(_enum_value)
+]
+
+
 # ==========================================
 # USER MANAGEMENT SCHEMAS
 # ==========================================
 
-class UserAdminListItem(BaseModel):
+class UserAdminListItem(TrustedReadMixin, ORMSchema):
     """
     Esquema para listar usuarios en panel administrativo.
     
@@ -44,33 +73,25 @@ class UserAdminListItem(BaseModel):
     """
     user_id: UUID = Field(..., description="ID del usuario")
     email: str = Field(..., description="Email del usuario")
-    full_name: Optional[str] = Field(None, description="Nombre completo")
-    role: UserRoleEnum = Field(..., description="Rol del usuario")
-    status: UserStatusEnum = Field(..., description="Estado del usuario")
+    full_name: Optional[str] = None
+    role: UserRoleValue = Field(..., description="Rol del usuario")
+    status: UserStatusValue = Field(..., description="Estado del usuario")
     created_at: datetime = Field(..., description="Fecha de registro")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
-class UserAdminList(BaseModel):
+class UserAdminList(PaginatedListMixin, PaginatedBase[UserAdminListItem]):
     """
     Esquema de respuesta paginada para lista de usuarios.
     
     Usado en: GET /api/v1/admin/users
     """
-    items: List[UserAdminListItem] = Field(..., description="Lista de usuarios")
-    total: int = Field(..., ge=0, description="Total de usuarios")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 # ==========================================
 # DASHBOARD SCHEMAS
 # ==========================================
 
-class StatsDashboard(BaseModel):
+class StatsDashboard(ORMSchema):
     """
     Esquema para estadísticas del dashboard administrativo.
     
@@ -86,10 +107,8 @@ class StatsDashboard(BaseModel):
     total_orders: int = Field(..., ge=0, description="Total de órdenes")
     pending_reports: int = Field(..., ge=0, description="Reportes pendientes de revisión")
     total_revenue: float = Field(..., ge=0, description="Ingresos totales de la plataforma")
-    
-    model_config = ConfigDict(from_attributes=True)
 
-class ModerationQueueItem(BaseModel):
+class ModerationQueueItem(TrustedReadMixin, ORMSchema):
     """
     Esquema para item en cola de moderación de publicaciones.
     
@@ -101,25 +120,17 @@ class ModerationQueueItem(BaseModel):
     seller_name: str = Field(..., description="Nombre del vendedor")
     category_name: str = Field(..., description="Categoría")
     price: float = Field(..., ge=0, description="Precio")
-    status: ModerationStatus = Field(..., description="Estado de moderación")
+    status: ModerationStatusValue = Field(..., description="Estado de moderación")
     created_at: datetime = Field(..., description="Fecha de creación")
-    submitted_at: Optional[datetime] = Field(None, description="Fecha de envío a moderación")
-    
-    model_config = ConfigDict(from_attributes=True)
+    submitted_at: Optional[datetime] = None
 
 
-class ModerationListingList(BaseModel):
+class ModerationListingList(PaginatedListMixin, PaginatedBase[ModerationQueueItem]):
     """
     Esquema de respuesta paginada para lista de publicaciones en moderación.
     
     Usado en: GET /api/v1/admin/moderation/listings
     """
-    items: List[ModerationQueueItem] = Field(..., description="Lista de publicaciones")
-    total: int = Field(..., ge=0, description="Total de publicaciones en moderación")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 class ListingModerationAction(BaseModel):
@@ -147,13 +158,13 @@ class ListingModerationResponse(BaseModel):
     Respuesta al aprobar o rechazar una publicación.
     """
     listing_id: int = Field(..., description="ID de la publicación")
-    new_status: ModerationStatus = Field(..., description="Nuevo estado")
+    new_status: ModerationStatusValue = Field(..., description="Nuevo estado")
     message: str = Field(..., description="Mensaje de confirmación")
     action_log_id: int = Field(..., description="ID del log de acción administrativa")
     
     model_config = ConfigDict(from_attributes=True)
 
-class ReportQueueItem(BaseModel):
+class ReportQueueItem(TrustedReadMixin, ORMSchema):
     """
     Esquema para item en cola de reportes.
     
@@ -166,25 +177,17 @@ class ReportQueueItem(BaseModel):
     reported_entity_id: int = Field(..., description="ID de la entidad reportada")
     reported_entity_description: str = Field(..., description="Descripción de la entidad")
     reason: str = Field(..., description="Razón del reporte")
-    description: Optional[str] = Field(None, description="Descripción detallada")
-    status: ReportStatus = Field(..., description="Estado del reporte")
+    description: Optional[str] = None
+    status: ReportStatusValue = Field(..., description="Estado del reporte")
     created_at: datetime = Field(..., description="Fecha de creación")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
-class ReportList(BaseModel):
+class ReportList(PaginatedListMixin, PaginatedBase[ReportQueueItem]):
     """
     Esquema de respuesta paginada para lista de reportes.
     
     Usado en: GET /api/v1/admin/moderation/reports
     """
-    items: List[ReportQueueItem] = Field(..., description="Lista de reportes")
-    total: int = Field(..., ge=0, description="Total de reportes")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 class ReportResolution(BaseModel):
@@ -218,13 +221,13 @@ class ReportResolutionResponse(BaseModel):
     Respuesta al resolver un reporte.
     """
     report_id: int = Field(..., description="ID del reporte")
-    new_status: ReportStatus = Field(..., description="Nuevo estado del reporte")
+    new_status: ReportStatusValue = Field(..., description="Nuevo estado del reporte")
     message: str = Field(..., description="Mensaje de confirmación")
     action_log_id: int = Field(..., description="ID del log de acción administrativa")
     
     model_config = ConfigDict(from_attributes=True)
 
-class AdminActionLogRead(BaseModel):
+class AdminActionLogRead(TrustedReadMixin, ORMSchema):
     """
     Esquema para leer logs de acciones administrativas.
     
@@ -234,22 +237,14 @@ class AdminActionLogRead(BaseModel):
     admin_id: UUID = Field(..., description="ID del administrador")
     admin_name: str = Field(..., description="Nombre del administrador")
     action_type: str = Field(..., description="Tipo de acción (approve_listing, reject_listing, etc.)")
-    target_type: Optional[str] = Field(None, description="Tipo de entidad objetivo")
-    target_id: Optional[int] = Field(None, description="ID de la entidad objetivo")
-    reason: Optional[str] = Field(None, description="Razón de la acción")
-    notes: Optional[str] = Field(None, description="Notas adicionales")
+    target_type: Optional[str] = None
+    target_id: Optional[int] = None
+    reason: Optional[str] = None
+    notes: Optional[str] = None
     created_at: datetime = Field(..., description="Fecha de la acción")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
-class AdminActionLogList(BaseModel):
+class AdminActionLogList(PaginatedListMixin, PaginatedBase[AdminActionLogRead]):
     """
     Esquema de respuesta paginada para logs administrativos.
     """
-    items: List[AdminActionLogRead] = Field(..., description="Lista de logs")
-    total: int = Field(..., ge=0, description="Total de logs")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""
+Utilidades compartidas para los schemas Pydantic.
+
+Autor: Oscar Alonso Nava Rivera
+Descripción: Mixins para construir schemas de respuesta desde filas ORM
+confiables sin volver a validarlas y para serializar listas paginadas.
+"""
+from decimal import Decimal
+from functools import cache
+from typing import Annotated, Any, Generic, NamedTuple, Sequence, TypeVar, get_args
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+from pydantic_core import to_json
+
+
+class ORMSchema(BaseModel):
+    """
+    Base común de los schemas de respuesta que se leen desde modelos ORM.
+
+    Centraliza la configuración en lugar de repetir un `ConfigDict` en cada
+    clase. `defer_build=True` pospone la construcción del core schema hasta
+    el primer uso, así un worker no paga al importar los schemas de
+    endpoints que nunca atiende.
+
+    No hace falta `Field(repr=False)` ni `init=False` para rendimiento: en
+    pydantic v2 `__init__` es el validador de pydantic-core (no se genera
+    código por campo), `init=False` solo aplica a dataclasses y `__repr__`
+    únicamente se evalúa cuando alguien imprime la instancia.
+    """
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+        defer_build=True
+    )
+
+
+# Montos en pesos guardados en columnas Numeric(10, 2). Un solo alias para no
+# repetir las restricciones (y su core schema) en cada campo de dinero. Los
+# montos con otro almacenamiento (p. ej. el costo de envío, en centavos
+# INTEGER) declaran su propio alias con el rango de su columna.
+Money = Annotated[Decimal, Field(gt=0, max_digits=10, decimal_places=2)]
+
+# Código de moneda ISO 4217; pydantic-core lo pasa a mayúsculas sin llamar a Python
+CurrencyStr = Annotated[str, StringConstraints(min_length=3, max_length=3, to_upper=True)]
+
+
+# URL http(s) que solo se guarda o se devuelve al cliente: un regex en
+# pydantic-core en lugar del parser completo de HttpUrl. HttpUrl se deja
+# para las URLs que Stripe visita (success_url, cancel_url, return_url).
+UrlStr = Annotated[str, StringConstraints(max_length=2048, pattern=r"^https?://\S+$")]
+
+
+T = TypeVar("T")
+
+
+class PaginatedBase(ORMSchema, Generic[T]):
+    """
+    Campos comunes de las respuestas paginadas, declarados una sola vez.
+
+    Cada *List hereda de la parametrización concreta
+    (`class FAQItemList(PaginatedBase[FAQItemRead])`) para conservar su
+    nombre en OpenAPI.
+    """
+    items: list[T] = Field(..., description="Elementos de la página")
+    total: int = Field(..., ge=0, description="Total de registros")
+    page: int = Field(..., ge=1, description="Página actual")
+    page_size: int = Field(..., ge=1, le=100, description="Items por página")
+
+
+# Defaults que se pueden compartir entre instancias sin copiarlos
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, Decimal)
+
+
+class _FieldPlan(NamedTuple):
+    names: tuple[str, ...]
+    required: frozenset[str]
+    static_defaults: dict[str, Any]
+    direct: bool
+
+
+@cache
+def _field_plan(schema: type[BaseModel]) -> _FieldPlan:
+    """
+    Plan de construcción de un schema, calculado una sola vez por clase.
+
+    `direct` indica si el schema admite la construcción directa de
+    `_construct` (sin model_post_init, atributos privados ni extra="allow").
+    """
+    fields = schema.model_fields
+    return _FieldPlan(
+        names=tuple(fields),
+        required=frozenset(name for name, field in fields.items() if field.is_required()),
+        static_defaults={
+            name: field.default
+            for name, field in fields.items()
+            if field.default_factory is None
+            and isinstance(field.default, _IMMUTABLE_DEFAULTS)
+        },
+        direct=(
+            schema.__pydantic_post_init__ is None
+            and not schema.__private_attributes__
+            and schema.model_config.get("extra") != "allow"
+        ),
+    )
+
+
+def _construct(schema: type[BaseModel], plan: _FieldPlan, data: dict[str, Any]) -> Any:
+    """
+    Equivalente a `schema.model_construct(**data)` sin su bucle genérico.
+
+    Arma `__dict__` en el orden de los campos (el serializer lo respeta).
+    Los defaults inmutables salen del plan; el resto (listas, factories)
+    se piden a `FieldInfo.get_default` para no compartirlos entre instancias.
+
+    Escribe los slots internos de `BaseModel` igual que `model_construct`;
+    tests/test_schemas_base.py compara ambos para cada schema con
+    `TrustedReadMixin`, así que un cambio de pydantic en esos slots rompe
+    el test y no la respuesta.
+    """
+    fields = schema.model_fields
+    static_defaults = plan.static_defaults
+    values = {
+        name: data[name] if name in data
+        else static_defaults[name] if name in static_defaults
+        else fields[name].get_default(call_default_factory=True, validated_data=data)
+        for name in plan.names
+    }
+    instance = schema.__new__(schema)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+class TrustedReadMixin:
+    """
+    Mixin para schemas de lectura (*Read / *InDB) construidos desde la BD.
+
+    Los valores de una fila ORM ya cumplen las restricciones de la tabla,
+    así que `from_orm_trusted` construye la instancia directamente (como
+    `model_construct`, con un plan de campos precalculado por clase) y se
+    salta la validación de pydantic-core. Los schemas de request (*Create, *Update)
+    deben seguir usando la validación normal.
+
+    Las columnas UUID se mantienen tipadas como `UUID`: cuando el valor ya
+    es un `uuid.UUID` (como lo entrega SQLAlchemy) pydantic-core lo acepta
+    con un isinstance, mientras que `str` + `BeforeValidator(str)` agrega
+    una llamada a Python por campo y pierde `format: uuid` en OpenAPI.
+    """
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, **extra: Any):
+        """
+        Construye el schema desde un objeto ORM sin validar.
+
+        Args:
+            obj: Instancia SQLAlchemy ya cargada (sin atributos expirados).
+            **extra: Campos calculados que no son columnas del modelo.
+
+        Returns:
+            Instancia del schema con los campos presentes en `obj.__dict__`
+            más `extra`; el resto toma su valor por defecto.
+
+        Note:
+            Lee `obj.__dict__`; solo si falta un campo requerido recurre a
+            getattr + validación. Las relaciones anidadas se deben pasar ya
+            construidas en `extra`.
+        """
+        plan = _field_plan(cls)
+        state = obj.__dict__
+        data = {name: state[name] for name in plan.names if name in state}
+        data.update(extra)
+        if not plan.required.issubset(data):
+            # Atributo expirado (p. ej. updated_at tras un UPDATE): leerlo
+            # del objeto y validar normalmente.
+            values = {
+                name: getattr(obj, name)
+                for name in plan.names
+                if name not in extra and hasattr(type(obj), name)
+            }
+            values.update(extra)
+            return cls.model_validate(values)
+        if plan.direct:
+            return _construct(cls, plan, data)
+        return cls.model_construct(_fields_set=set(data), **data)
+
+
+@cache
+def _items_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """
+    `TypeAdapter` del campo `items` de un *List, uno por clase.
+
+    Se construye en el primer uso y no al importar, para no deshacer el
+    `defer_build` de los schemas. Antes se completa el schema diferido del
+    item para que el adapter lo reutilice en lugar de generarlo otra vez.
+    """
+    annotation = schema.model_fields["items"].annotation
+    for item in get_args(annotation):
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            item.model_rebuild()
+    return TypeAdapter(annotation)
+
+
+_PAGE_FIELDS = frozenset({"items", "total", "page", "page_size"})
+
+
+@cache
+def _extra_fields(schema: type[BaseModel]) -> tuple[frozenset[str], frozenset[str]]:
+    """Campos del wrapper fuera de la paginación: (todos, requeridos)."""
+    extra = {
+        name: field for name, field in schema.model_fields.items()
+        if name not in _PAGE_FIELDS
+    }
+    required = {name for name, field in extra.items() if field.is_required()}
+    return frozenset(extra), frozenset(required)
+
+
+class PaginatedListMixin:
+    """
+    Mixin para los schemas de respuesta paginada (*List).
+
+    `items_adapter()` devuelve un `TypeAdapter` del tipo del campo `items`,
+    construido en el primer uso y cacheado por clase. `json_response`
+    serializa los items con ese adapter y arma el JSON del wrapper
+    directamente, sin construir ni revalidar la instancia del *List en cada
+    request.
+
+    El endpoint conserva `response_model=<*List>` para la documentación
+    OpenAPI; FastAPI devuelve un `Response` tal cual, sin volver a validarlo.
+    Por eso el contrato se garantiza aquí: los items se serializan con el
+    adapter del campo `items` del propio *List y los campos extra deben ser
+    exactamente los que declara el wrapper (TypeError si sobra uno o falta
+    uno requerido). Así el JSON siempre valida con
+    `<*List>.model_validate_json`; tests/test_schemas_base.py lo comprueba
+    para cada subclase.
+
+    Se usa `dump_json` y no `orjson.dumps(adapter.dump_python(..., mode="json"))`:
+    el segundo arma primero los dicts en Python y resulta más lento.
+    """
+    @classmethod
+    def items_adapter(cls) -> TypeAdapter:
+        """Adapter de `list[...Read]` derivado del campo `items`."""
+        return _items_adapter(cls)
+
+    @classmethod
+    def json_response(
+        cls,
+        items: Sequence[Any],
+        total: int,
+        page: int,
+        page_size: int,
+        **extra: Any
+    ) -> Response:
+        """
+        Serializa una página de resultados.
+
+        Args:
+            items: Instancias de los schemas de lectura de la página.
+            total: Total de registros.
+            page: Página actual.
+            page_size: Items por página.
+            **extra: Campos adicionales del wrapper (ej. `unread_count`,
+                `total_pending_amount`).
+
+        Returns:
+            Response: JSON con `items`, `total`, `page`, `page_size` y `extra`.
+
+        Raises:
+            TypeError: Si `extra` trae un campo que el wrapper no declara o
+                falta uno requerido.
+        """
+        allowed, required = _extra_fields(cls)
+        if not allowed.issuperset(extra) or not required.issubset(extra):
+            raise TypeError(
+                f"{cls.__name__}.json_response: campos extra {sorted(extra)}, "
+                f"se esperan {sorted(allowed)} (requeridos: {sorted(required)})"
+            )
+        meta = to_json({"total": total, "page": page, "page_size": page_size, **extra})
+        body = b"".join((
+            b'{"items":',
+            cls.items_adapter().dump_json(list(items)),
+            b",",
+            meta[1:],
+        ))
+        return Response(content=body, media_type="application/json")
@@ -14,7 +14,9 @@ from decimal import Decimal
 from datetime import datetime
 import uuid
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator
+
+from app.schemas.base import ORMSchema, TrustedReadMixin
 
 
 # SCHEMAS PARA CART ITEM
@@ -36,7 +38,7 @@ class CartItemUpdate(BaseModel):
     quantity: int = Field(..., gt=0, description="Nueva cantidad")
 
 
-class CartItemRead(CartItemBase):
+class CartItemRead(TrustedReadMixin, ORMSchema, CartItemBase):
     """Schema de respuesta para un item del carrito."""
     
     cart_item_id: int
@@ -55,11 +57,9 @@ class CartItemRead(CartItemBase):
     # Cálculos
     item_subtotal: Decimal = Decimal("0.00")
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 # SCHEMAS PARA CART
-class CartRead(BaseModel):
+class CartRead(TrustedReadMixin, ORMSchema):
     """Schema de respuesta completo para el carrito."""
     
     cart_id: int
@@ -77,15 +77,11 @@ class CartRead(BaseModel):
     estimated_total: Decimal = Decimal("0.00")
     has_unavailable_items: bool = False
 
-    model_config = ConfigDict(from_attributes=True)
 
-
-class CartSummary(BaseModel):
+class CartSummary(ORMSchema):
     """Schema con resumen simplificado del carrito."""
     
     cart_id: int
     total_items: int
     subtotal: Decimal
     items_count: int = Field(..., description="Número de líneas en el carrito")
-
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
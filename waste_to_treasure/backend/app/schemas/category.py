@@ -4,11 +4,12 @@ Esquemas de Pydantic para el modelo Category.
 Define los contratos de entrada y salida para las operaciones CRUD 
 sobre las categorías en los marketplaces.
 """
-from typing import Optional, List
+from typing import ClassVar, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from pydantic import BaseModel, Field, TypeAdapter, field_serializer
 
 from app.models.category import ListingTypeEnum
+from app.schemas.base import ORMSchema, PaginatedBase, PaginatedListMixin, TrustedReadMixin
 
 
 class CategoryBase(BaseModel):
@@ -74,7 +75,7 @@ class CategoryUpdate(BaseModel):
     )
 
 
-class CategoryInDB(CategoryBase):
+class CategoryInDB(TrustedReadMixin, ORMSchema, CategoryBase):
     """
     Autor: Oscar Alonso Nava Rivera
     Descripción: Esquema que representa cómo se almacena Category en la base de datos.
@@ -85,13 +86,6 @@ class CategoryInDB(CategoryBase):
     slug: str = Field(..., description="Slug único para URLs")
     created_at: datetime = Field(..., description="Fecha de creación")
     updated_at: datetime = Field(..., description="Última actualización")
-    
-    model_config = ConfigDict(
-        from_attributes=True,
-        # Importante: solo serializar campos definidos explícitamente
-        # Esto evita que Pydantic intente acceder a 'children' en modelos SQLAlchemy
-        populate_by_name=True
-    )
 
 
 class CategoryRead(CategoryInDB):
@@ -104,11 +98,8 @@ class CategoryRead(CategoryInDB):
 
     Usado en: POST, PATCH, GET individual, lista paginada
     """
-    # Campo computado: ruta completa de la jerarquía  
-    full_path: Optional[str] = Field(
-        None,
-        description="Ruta completa en la jerarquía (ej: 'Electrónica > Móviles')"
-    )
+    # Columna desnormalizada: ruta completa (ej: 'Electrónica > Móviles')
+    full_path: Optional[str] = None
     
     # Campos de conteo para validación en frontend
     listing_count: int = Field(
@@ -133,11 +124,8 @@ class Category(CategoryInDB):
 
     Usado en: Respuestas que incluyen la relación children (árbol, lista con hijos)
     """
-    # Campo computado: ruta completa de la jerarquía
-    full_path: Optional[str] = Field(
-        None,
-        description="Ruta completa en la jerarquía (ej: 'Electrónica > Móviles')"
-    )
+    # Columna desnormalizada: ruta completa (ej: 'Electrónica > Móviles')
+    full_path: Optional[str] = None
     
     # Relaciones (opcionales según lazy loading)
     children: Optional[List["Category"]] = Field(
@@ -159,7 +147,24 @@ class CategoryWithChildren(Category):
     )
 
 
-class CategoryList(BaseModel):
+class CategoryNode(CategoryInDB):
+    """
+    Autor: Oscar Alonso Nava Rivera
+    Descripción: Nodo del árbol de categorías.
+
+    Documenta en OpenAPI la forma de cada nodo de GET /api/v1/categories/tree.
+    El endpoint arma el árbol como dicts planos y los serializa sin pasar
+    por la validación recursiva de este modelo.
+    """
+    # Columna desnormalizada: ruta completa (ej: 'Electrónica > Móviles')
+    full_path: Optional[str] = None
+    children: List["CategoryNode"] = Field(
+        default_factory=list,
+        description="Subcategorías hijas con sus propios hijos"
+    )
+
+
+class CategoryList(PaginatedListMixin, PaginatedBase[CategoryRead]):
     """
     Autor: Oscar Alonso Nava Rivera
     Descripción: Esquema de respuesta paginada para listar categorías.
@@ -168,12 +173,6 @@ class CategoryList(BaseModel):
 
     Usa CategoryRead (sin children) para evitar problemas de lazy loading.
     """
-    items: List[CategoryRead] = Field(..., description="Lista de categorías")
-    total: int = Field(..., ge=0, description="Total de categorías encontradas")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoryTree(BaseModel):
@@ -183,17 +182,15 @@ class CategoryTree(BaseModel):
 
     Usado en: GET /api/v1/categories/tree
     """
-    materials: List[CategoryWithChildren] = Field(
+    materials: List[CategoryNode] = Field(
         default_factory=list,
         description="Árbol de categorías del marketplace de materiales"
     )
-    products: List[CategoryWithChildren] = Field(
+    products: List[CategoryNode] = Field(
         default_factory=list,
         description="Árbol de categorías del marketplace de productos"
     )
 
-
-# Configurar referencias circulares para los modelos recursivos
-CategoryRead.model_rebuild()
-Category.model_rebuild()
-CategoryWithChildren.model_rebuild()
+    # El endpoint serializa los dicts del servicio con este adapter;
+    # los campos de arriba solo documentan la respuesta.
+    tree_adapter: ClassVar[TypeAdapter] = TypeAdapter(dict[str, list[dict]])
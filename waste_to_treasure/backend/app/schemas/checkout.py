@@ -6,9 +6,10 @@ Define los contratos para crear sesiones de pago con Stripe.
 from typing import Optional, List, Dict, Any
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 from app.models.payment_enums import PaymentGatewayEnum
+from app.schemas.base import CurrencyStr, Money, UrlStr
 
 
 class CheckoutLineItem(BaseModel):
@@ -39,22 +40,18 @@ class CheckoutLineItem(BaseModel):
         examples=[2]
     )
     
-    unit_amount: Decimal = Field(
+    unit_amount: Money = Field(
         ...,
-        gt=0,
-        decimal_places=2,
         description="Precio unitario",
         examples=[Decimal("50.00")]
     )
     
-    currency: str = Field(
+    currency: CurrencyStr = Field(
         default="MXN",
-        min_length=3,
-        max_length=3,
         description="Moneda del precio"
     )
     
-    images: Optional[List[HttpUrl]] = Field(
+    images: Optional[List[UrlStr]] = Field(
         None,
         max_length=8,
         description="URLs de imágenes del producto"
@@ -81,14 +78,12 @@ class CheckoutRequest(BaseModel):
     
     success_url: HttpUrl = Field(
         ...,
-        description="URL de redirección tras pago exitoso",
-        examples=["https://waste-to-treasure.com/orders/123/success"]
+        description="URL de redirección tras pago exitoso"
     )
     
     cancel_url: HttpUrl = Field(
         ...,
-        description="URL de redirección si usuario cancela",
-        examples=["https://waste-to-treasure.com/orders/123/cancel"]
+        description="URL de redirección si usuario cancela"
     )
     
     save_payment_method: bool = Field(
@@ -118,14 +113,12 @@ class CheckoutSessionResponse(BaseModel):
     """
     session_id: str = Field(
         ...,
-        description="ID de la sesión de checkout en Stripe",
-        examples=["cs_test_a1b2c3d4e5f6g7h8i9j0"]
+        description="ID de la sesión de checkout en Stripe"
     )
     
-    url: HttpUrl = Field(
+    url: UrlStr = Field(
         ...,
-        description="URL de Stripe Checkout para redirigir al usuario",
-        examples=["https://checkout.stripe.com/c/pay/cs_test_a1b2c3d4e5f6g7h8i9j0"]
+        description="URL de Stripe Checkout para redirigir al usuario"
     )
     
     expires_at: Optional[int] = Field(
@@ -134,6 +127,7 @@ class CheckoutSessionResponse(BaseModel):
     )
     
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "session_id": "cs_test_a1b2c3d4e5f6g7h8i9j0",
@@ -161,8 +155,7 @@ class PaymentIntentRequest(BaseModel):
     payment_method_id: str = Field(
         ...,
         min_length=1,
-        description="ID del método de pago de Stripe Elements",
-        examples=["pm_1AbCdEfGhIjKlMnO"]
+        description="ID del método de pago de Stripe Elements"
     )
     
     gateway: PaymentGatewayEnum = Field(
@@ -220,6 +213,8 @@ class PaymentIntentResponse(BaseModel):
         description="Siguiente acción requerida (redirect, etc)"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class PaymentConfirmation(BaseModel):
     """
@@ -251,6 +246,8 @@ class PaymentConfirmation(BaseModel):
         description="Mensaje para el usuario"
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class PaymentError(BaseModel):
     """
@@ -281,4 +278,6 @@ class PaymentError(BaseModel):
     can_retry: bool = Field(
         default=True,
         description="Si el usuario puede reintentar"
-    )
\ No newline at end of file
+    )
+
+    model_config = ConfigDict(frozen=True)
@@ -8,9 +8,28 @@ Esquemas de Pydantic para el modelo FAQItem.
 
 Define los contratos de entrada y salida para preguntas frecuentes (FAQ).
 """
-from typing import Optional
+from typing import Annotated, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, StringConstraints, ValidationInfo
+from app.schemas.base import PaginatedBase, PaginatedListMixin, TrustedReadMixin
+
+def _not_blank(v: str, info: ValidationInfo) -> str:
+    """
+    Valida que question/answer no sean solo espacios.
+
+    Corre después de min_length, así que `isspace()` basta y no copia el
+    texto como `strip()`. Va dentro del tipo y no como field_validator para
+    que en FAQItemUpdate un `None` no llegue a Python.
+    """
+    if v.isspace():
+        raise ValueError(f"El campo {info.field_name} no puede estar vacío")
+    return v
+
+
+# Tipos con restricciones compartidos por FAQItemBase y FAQItemUpdate
+QuestionStr = Annotated[str, StringConstraints(min_length=10, max_length=500), AfterValidator(_not_blank)]
+AnswerStr = Annotated[str, StringConstraints(min_length=20), AfterValidator(_not_blank)]
+FAQCategoryStr = Annotated[str, StringConstraints(min_length=2, max_length=100)]
 
 
 class FAQItemBase(BaseModel):
@@ -19,23 +38,18 @@ class FAQItemBase(BaseModel):
     
     Contiene los campos que se usan tanto en creación como actualización.
     """
-    question: str = Field(
+    question: QuestionStr = Field(
         ...,
-        min_length=10,
-        max_length=500,
         description="Pregunta frecuente",
         examples=["¿Cómo puedo vender en la plataforma?", "¿Cuáles son los métodos de pago?"]
     )
-    answer: str = Field(
+    answer: AnswerStr = Field(
         ...,
-        min_length=20,
         description="Respuesta a la pregunta (puede incluir markdown)",
         examples=["Para vender en la plataforma, primero debes crear una cuenta..."]
     )
-    category: str = Field(
+    category: FAQCategoryStr = Field(
         ...,
-        min_length=2,
-        max_length=100,
         description="Categoría de la FAQ",
         examples=["Ventas", "Compras", "Cuenta", "Pagos", "Envíos"]
     )
@@ -49,15 +63,6 @@ class FAQItemBase(BaseModel):
         description="Indica si la FAQ está activa y visible"
     )
 
-    @field_validator("question", "answer")
-    @classmethod
-    def validate_not_empty(cls, v: str, info) -> str:
-        """Valida que los campos no sean solo espacios."""
-        if v.strip() == "":
-            field_name = info.field_name
-            raise ValueError(f"El campo {field_name} no puede estar vacío")
-        return v
-
 
 class FAQItemCreate(FAQItemBase):
     """
@@ -81,21 +86,16 @@ class FAQItemUpdate(BaseModel):
     Usado en: PATCH /api/v1/faq/{faq_id} (Admin only)
     Requiere: Rol ADMIN
     """
-    question: Optional[str] = Field(
+    question: Optional[QuestionStr] = Field(
         None,
-        min_length=10,
-        max_length=500,
         description="Pregunta"
     )
-    answer: Optional[str] = Field(
+    answer: Optional[AnswerStr] = Field(
         None,
-        min_length=20,
         description="Respuesta"
     )
-    category: Optional[str] = Field(
+    category: Optional[FAQCategoryStr] = Field(
         None,
-        min_length=2,
-        max_length=100,
         description="Categoría"
     )
     display_order: Optional[int] = Field(
@@ -108,20 +108,12 @@ class FAQItemUpdate(BaseModel):
         description="Estado de activación"
     )
 
-    @field_validator("question", "answer")
-    @classmethod
-    def validate_not_empty(cls, v: Optional[str], info) -> Optional[str]:
-        """Valida que los campos no sean solo espacios."""
-        if v is not None and v.strip() == "":
-            field_name = info.field_name
-            raise ValueError(f"El campo {field_name} no puede estar vacío")
-        return v
-
 
-class FAQItemInDB(FAQItemBase):
+class FAQItemRead(TrustedReadMixin, FAQItemBase):
     """
-    Esquema que representa cómo se almacena FAQItem en la base de datos.
+    Esquema de respuesta para FAQItem, tal como se almacena en la base de datos.
     
+    Usado en: GET endpoints (público y admin).
     Incluye campos autogenerados como ID, created_by_id y timestamps.
     """
     faq_id: int = Field(..., description="Identificador único")
@@ -138,27 +130,16 @@ class FAQItemInDB(FAQItemBase):
     )
 
 
-class FAQItemRead(FAQItemInDB):
-    """
-    Esquema de respuesta para FAQItem.
-    
-    Usado en: GET endpoints (público y admin).
-    """
-    pass
+# Un solo schema (y un solo SchemaValidator) para lectura y almacenamiento
+FAQItemInDB = FAQItemRead
 
 
-class FAQItemList(BaseModel):
+class FAQItemList(PaginatedListMixin, PaginatedBase[FAQItemRead]):
     """
     Esquema de respuesta paginada para listar FAQs.
     
     Usado en: GET /api/v1/faq (público y admin)
     """
-    items: list[FAQItemRead] = Field(..., description="Lista de FAQs")
-    total: int = Field(..., ge=0, description="Total de FAQs")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
 
 class FAQCategory(BaseModel):
     """
@@ -170,7 +151,7 @@ class FAQCategory(BaseModel):
     items: list[FAQItemRead] = Field(..., description="FAQs de la categoría")
     count: int = Field(..., ge=0, description="Número de FAQs en la categoría")
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FAQCategoryList(BaseModel):
@@ -183,4 +164,4 @@ class FAQCategoryList(BaseModel):
     total_faqs: int = Field(..., ge=0, description="Total de FAQs activas")
     total_categories: int = Field(..., ge=0, description="Número de categorías")
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True)
\ No newline at end of file
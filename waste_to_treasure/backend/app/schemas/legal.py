@@ -9,10 +9,29 @@ Esquemas de Pydantic para el modelo LegalDocument.
 Define los contratos de entrada y salida para documentos legales
 como términos de servicio, políticas de privacidad, etc.
 """
-from typing import Optional
+from typing import Annotated, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-import re
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, StringConstraints
+from app.schemas.base import PaginatedBase, PaginatedListMixin, TrustedReadMixin
+
+# Tipos con restricciones compartidos por LegalDocumentBase y LegalDocumentUpdate
+LegalTitleStr = Annotated[str, StringConstraints(min_length=5, max_length=200)]
+# Solo minúsculas, números y guiones
+LegalSlugStr = Annotated[str, StringConstraints(min_length=3, max_length=100, pattern="^[a-z0-9-]+$")]
+LegalContentStr = Annotated[str, StringConstraints(min_length=100)]
+VersionStr = Annotated[str, StringConstraints(max_length=20)]
+
+
+def _content_not_blank(v: str) -> str:
+    """
+    Valida que el contenido no sea solo espacios.
+
+    Va dentro del tipo de LegalDocumentUpdate.content y no como
+    field_validator para que un `None` no llegue a Python.
+    """
+    if v.isspace():
+        raise ValueError("El contenido no puede estar vacío")
+    return v
 
 
 class LegalDocumentBase(BaseModel):
@@ -21,30 +40,23 @@ class LegalDocumentBase(BaseModel):
     
     Contiene los campos que se usan tanto en creación como actualización.
     """
-    title: str = Field(
+    title: LegalTitleStr = Field(
         ...,
-        min_length=5,
-        max_length=200,
         description="Título del documento legal",
         examples=["Términos y Condiciones de Servicio", "Política de Privacidad"]
     )
-    slug: str = Field(
+    slug: LegalSlugStr = Field(
         ...,
-        min_length=3,
-        max_length=100,
-        pattern="^[a-z0-9-]+$",
         description="Identificador único URL-friendly",
         examples=["terms-of-service", "privacy-policy", "refund-policy"]
     )
-    content: str = Field(
+    content: LegalContentStr = Field(
         ...,
-        min_length=100,
         description="Contenido completo del documento (puede incluir markdown)",
         examples=["# Términos y Condiciones\n\n## 1. Aceptación de términos..."]
     )
-    version: str = Field(
+    version: VersionStr = Field(
         default="1.0",
-        max_length=20,
         description="Versión del documento",
         examples=["1.0", "2.1", "3.0.1"]
     )
@@ -53,16 +65,6 @@ class LegalDocumentBase(BaseModel):
         description="Indica si el documento está activo y visible"
     )
 
-    @field_validator("slug")
-    @classmethod
-    def validate_slug_format(cls, v: str) -> str:
-        """Valida que el slug tenga formato válido."""
-        if not re.match(r"^[a-z0-9-]+$", v):
-            raise ValueError(
-                "El slug solo puede contener letras minúsculas, números y guiones"
-            )
-        return v
-
 
 class LegalDocumentCreate(LegalDocumentBase):
     """
@@ -87,20 +89,16 @@ class LegalDocumentUpdate(BaseModel):
     Usado en: PATCH /api/v1/legal/{slug} (Admin only)
     Requiere: Rol ADMIN
     """
-    title: Optional[str] = Field(
+    title: Optional[LegalTitleStr] = Field(
         None,
-        min_length=5,
-        max_length=200,
         description="Título del documento"
     )
-    content: Optional[str] = Field(
+    content: Optional[Annotated[LegalContentStr, AfterValidator(_content_not_blank)]] = Field(
         None,
-        min_length=100,
         description="Contenido del documento"
     )
-    version: Optional[str] = Field(
+    version: Optional[VersionStr] = Field(
         None,
-        max_length=20,
         description="Versión del documento"
     )
     is_active: Optional[bool] = Field(
@@ -108,19 +106,12 @@ class LegalDocumentUpdate(BaseModel):
         description="Estado de activación"
     )
 
-    @field_validator("content")
-    @classmethod
-    def validate_content_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        """Valida que el contenido no sea solo espacios."""
-        if v is not None and v.strip() == "":
-            raise ValueError("El contenido no puede estar vacío")
-        return v
-
 
-class LegalDocumentInDB(LegalDocumentBase):
+class LegalDocumentRead(TrustedReadMixin, LegalDocumentBase):
     """
-    Esquema que representa cómo se almacena LegalDocument en la base de datos.
+    Esquema de respuesta para LegalDocument, tal como se almacena en la base de datos.
     
+    Usado en: GET endpoints (público y admin).
     Incluye campos autogenerados como ID, created_by_id y timestamps.
     """
     document_id: int = Field(..., description="Identificador único")
@@ -137,29 +128,19 @@ class LegalDocumentInDB(LegalDocumentBase):
     )
 
 
-class LegalDocumentRead(LegalDocumentInDB):
-    """
-    Esquema de respuesta para LegalDocument.
-    
-    Usado en: GET endpoints (público y admin).
-    """
-    pass
+# Un solo schema (y un solo SchemaValidator) para lectura y almacenamiento
+LegalDocumentInDB = LegalDocumentRead
 
 
-class LegalDocumentList(BaseModel):
+class LegalDocumentList(PaginatedListMixin, PaginatedBase[LegalDocumentRead]):
     """
     Esquema de respuesta paginada para listar documentos legales.
     
     Usado en: GET /api/v1/legal (público y admin)
     """
-    items: list[LegalDocumentRead] = Field(..., description="Lista de documentos")
-    total: int = Field(..., ge=0, description="Total de documentos")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
 
-class LegalDocumentSummary(BaseModel):
+
+class LegalDocumentSummary(TrustedReadMixin, BaseModel):
     """
     Esquema simplificado para listados públicos.
     
@@ -171,7 +152,7 @@ class LegalDocumentSummary(BaseModel):
     version: str = Field(..., description="Versión")
     updated_at: datetime = Field(..., description="Última actualización")
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LegalDocumentSummaryList(BaseModel):
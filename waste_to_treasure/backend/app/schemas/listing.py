@@ -9,22 +9,29 @@ Schemas Pydantic para Listing.
 
 Define los modelos de validación para requests y responses de la API.
 """
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from decimal import Decimal
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, HttpUrl, computed_field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, computed_field
 
 from app.models.listing import ListingStatusEnum
 from app.models.category import ListingTypeEnum
+from app.schemas.base import Money, PaginatedBase, PaginatedListMixin, UrlStr
 from app.schemas.user import UserPublic
 
+# Tipos con restricciones compartidos por ListingBase y ListingUpdate
+ListingTitleStr = Annotated[str, StringConstraints(min_length=10, max_length=255)]
+ListingDescriptionStr = Annotated[str, StringConstraints(min_length=50)]
+PriceUnitStr = Annotated[str, StringConstraints(max_length=50)]
+OriginStr = Annotated[str, StringConstraints(max_length=1000)]
+
 
 # SCHEMAS DE LISTING IMAGE
 class ListingImageBase(BaseModel):
     """Schema base para imágenes de listing."""
-    image_url: HttpUrl = Field(..., description="URL de la imagen en S3")
+    image_url: UrlStr = Field(..., description="URL de la imagen en S3")
     is_primary: bool = Field(False, description="Indica si es la imagen principal")
 
 
@@ -39,24 +46,23 @@ class ListingImageRead(ListingImageBase):
     listing_id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # SCHEMAS BASE DE LISTING
 class ListingBase(BaseModel):
     """Schema base con campos comunes de Listing."""
     
-    title: str = Field(..., min_length=10, max_length=255, description="Título de la publicación")
-    description: str = Field(..., min_length=50, description="Descripción detallada")
-    price: Decimal = Field(..., gt=0, decimal_places=2, description="Precio del ítem")
-    price_unit: Optional[str] = Field(None, max_length=50, description="Unidad de precio (Kg, Unidad, etc)")
+    title: ListingTitleStr = Field(..., description="Título de la publicación")
+    description: ListingDescriptionStr = Field(..., description="Descripción detallada")
+    price: Money = Field(..., description="Precio del ítem")
+    price_unit: Optional[PriceUnitStr] = Field(None, description="Unidad de precio (Kg, Unidad, etc)")
     # Allow zero in the base/read schema (0 = out of stock).
     # Creation uses a stricter validation (gt=0) via ListingCreate override.
     quantity: int = Field(..., ge=0, description="Cantidad disponible en stock")
     category_id: int = Field(..., gt=0, description="ID de la categoría")
     listing_type: ListingTypeEnum = Field(..., description="Tipo: MATERIAL o PRODUCT")
-    origin_description: Optional[str] = Field(None, max_length=1000, description="Origen reciclado del material")
+    origin_description: Optional[OriginStr] = Field(None, description="Origen reciclado del material")
     location_address_id: Optional[int] = Field(None, description="ID de la ubicación física")
 
 
@@ -68,33 +74,17 @@ class ListingCreate(ListingBase):
     images: Optional[List[str]] = Field(None, description="URLs de imágenes en S3")
     # For creation, require quantity > 0
     quantity: int = Field(..., gt=0, description="Cantidad inicial disponible (debe ser mayor que 0)")
-    
-    @field_validator('listing_type')
-    def validate_listing_type(cls, v):
-        """
-        Autor: Arturo Perez Gonzalez
-        Descripción: Valida que el tipo de listing sea MATERIAL o PRODUCT.
-        Parámetros:
-            v (ListingTypeEnum): Valor del tipo de listing a validar.
-        Retorna:
-            ListingTypeEnum: Valor validado si es correcto.
-        Raises:
-            ValueError: Si el tipo no es MATERIAL ni PRODUCT.
-        """
-        if v not in [ListingTypeEnum.MATERIAL, ListingTypeEnum.PRODUCT]:
-            raise ValueError('listing_type debe ser MATERIAL o PRODUCT')
-        return v
 
 
 class ListingUpdate(BaseModel):
     """Schema para actualizar una publicación existente."""
     
-    title: Optional[str] = Field(None, min_length=10, max_length=255)
-    description: Optional[str] = Field(None, min_length=50)
-    price: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
-    price_unit: Optional[str] = Field(None, max_length=50)
+    title: Optional[ListingTitleStr] = None
+    description: Optional[ListingDescriptionStr] = None
+    price: Optional[Money] = None
+    price_unit: Optional[PriceUnitStr] = None
     quantity: Optional[int] = Field(None, ge=0, description="Cantidad disponible (0 = sin stock)")
-    origin_description: Optional[str] = Field(None, max_length=1000)
+    origin_description: Optional[OriginStr] = None
     location_address_id: Optional[int] = None
 
 
@@ -109,7 +99,7 @@ class ListingRead(ListingBase):
     """Schema de respuesta completo para una publicación."""
 
     listing_id: int
-    seller_id: UUID  # Cambiar a UUID, usaremos field_serializer para convertir a string
+    seller_id: UUID  # pydantic-core lo serializa como string en JSON
     seller: Optional[UserPublic] = None
     status: ListingStatusEnum
     approved_by_admin_id: Optional[UUID] = None
@@ -120,13 +110,7 @@ class ListingRead(ListingBase):
     # Relaciones
     images: List[ListingImageRead] = []
 
-    class Config:
-        from_attributes = True
-
-    @field_serializer('seller_id', 'approved_by_admin_id')
-    def serialize_uuid(self, value: Optional[UUID], _info) -> Optional[str]:
-        """Convierte UUID a string para la respuesta JSON."""
-        return str(value) if value else None
+    model_config = ConfigDict(from_attributes=True)
 
     @computed_field
     @property
@@ -142,8 +126,8 @@ class ListingRead(ListingBase):
             return None
         for img in self.images:
             if img.is_primary:
-                return str(img.image_url)
-        return str(self.images[0].image_url) if self.images else None
+                return img.image_url
+        return self.images[0].image_url
 
 
 class ListingCardRead(BaseModel):
@@ -163,22 +147,11 @@ class ListingCardRead(BaseModel):
     quantity: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
-    @field_serializer('seller_id')
-    def serialize_seller_uuid(self, value: UUID, _info) -> str:
-        """Convierte seller_id UUID a string."""
-        return str(value)
+    model_config = ConfigDict(from_attributes=True)
 
 
-class ListingListResponse(BaseModel):
+class ListingListResponse(PaginatedListMixin, PaginatedBase[ListingCardRead]):
     """Schema para listado paginado."""
-    
-    total: int = Field(..., description="Total de resultados")
-    page: int = Field(..., description="Página actual")
-    page_size: int = Field(..., description="Tamaño de página")
-    items: List[ListingCardRead] = Field(..., description="Lista de publicaciones")
 
 
 # SCHEMAS PARA UPLOAD DE IMÁGENES
@@ -188,21 +161,13 @@ class ImageUploadResponse(BaseModel):
     image_id: int = Field(..., description="ID de la imagen en BD")
     is_primary: bool = Field(..., description="Si es la imagen principal")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class BulkImageUploadResponse(BaseModel):
     """Schema de respuesta para múltiples imágenes."""
     images: List[ImageUploadResponse]
     primary_image_url: str
 
+    model_config = ConfigDict(frozen=True)
 
-# SCHEMAS PARA FILTROS
-class ListingFilters(BaseModel):
-    """Schema para filtros de búsqueda."""
-
-    listing_type: Optional[ListingTypeEnum] = None
-    category_id: Optional[int] = None
-    min_price: Optional[Decimal] = Field(None, ge=0)
-    max_price: Optional[Decimal] = Field(None, ge=0)
-    search: Optional[str] = Field(None, min_length=3, max_length=100)
-    status: Optional[ListingStatusEnum] = None
-    seller_id: Optional[int] = None
\ No newline at end of file
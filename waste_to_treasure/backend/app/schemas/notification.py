@@ -12,10 +12,13 @@ sobre las notificaciones "in-app" del usuario.
 """
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 
-class NotificationRead(BaseModel):
+from app.schemas.base import PaginatedBase, PaginatedListMixin, TrustedReadMixin
+
+
+class NotificationRead(TrustedReadMixin, BaseModel):
     """
     Schema para leer una notificación individual.
     """
@@ -38,12 +41,8 @@ class NotificationRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class NotificationList(BaseModel):
+class NotificationList(PaginatedListMixin, PaginatedBase[NotificationRead]):
     """
     Schema para respuestas paginadas de listas de notificaciones.
     """
-    items: List[NotificationRead]
-    total: int = Field(..., ge=0, description="Total de notificaciones encontradas")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, description="Items por página")
-    unread_count: int = Field(..., ge=0, description="Total de notificaciones no leídas")
\ No newline at end of file
+    unread_count: int = Field(..., ge=0, description="Total de notificaciones no leídas")
@@ -10,13 +10,14 @@ Esquemas de Pydantic para Offer.
 Define los contratos de entrada y salida para operaciones sobre ofertas B2B.
 """
 from decimal import Decimal
-from typing import Optional
-from datetime import datetime
+from typing import Literal, Optional
+from datetime import datetime, timezone
 from uuid import UUID
-from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from enum import Enum
 
 from app.models.offer import OfferStatusEnum
+from app.schemas.base import Money, PaginatedBase, PaginatedListMixin
 
 
 # SCHEMAS BASE
@@ -24,7 +25,7 @@ class OfferBase(BaseModel):
     """Schema base con campos comunes de Offer."""
 
     listing_id: int = Field(..., gt=0, description="ID del material")
-    offer_price: Decimal = Field(..., gt=0, decimal_places=2, description="Precio unitario ofertado")
+    offer_price: Money = Field(..., description="Precio unitario ofertado")
     quantity: int = Field(..., gt=0, description="Cantidad solicitada")
     expires_at: Optional[datetime] = Field(None, description="Fecha de expiración")
 
@@ -41,11 +42,8 @@ class OfferBase(BaseModel):
         Raises:
             ValueError: Si la fecha no es futura.
         """
-        if v is not None:
-            from datetime import timezone
-            now = datetime.now(timezone.utc)
-            if v <= now:
-                raise ValueError('La fecha de expiración debe ser futura')
+        if v is not None and v <= datetime.now(timezone.utc):
+            raise ValueError('La fecha de expiración debe ser futura')
         return v
 
 
@@ -59,28 +57,10 @@ class OfferCreate(OfferBase):
 class OfferUpdateStatus(BaseModel):
     """Schema para actualizar el estado de una oferta (vendedor)."""
 
-    action: str = Field(..., description="Acción: 'accept', 'reject', o 'counter'")
-    counter_offer_price: Optional[Decimal] = Field(None, gt=0, decimal_places=2, description="Precio de contraoferta")
+    action: Literal['accept', 'reject', 'counter'] = Field(..., description="Acción: 'accept', 'reject', o 'counter'")
+    counter_offer_price: Optional[Money] = Field(None, description="Precio de contraoferta")
     rejection_reason: Optional[str] = Field(None, min_length=10, max_length=500, description="Motivo del rechazo")
 
-    @field_validator('action')
-    @classmethod
-    def validate_action(cls, v):
-        """
-        Autor: Arturo Perez Gonzalez
-        Descripción: Valida que la acción sea 'accept', 'reject' o 'counter'.
-        Parámetros:
-            v (str): Acción a validar.
-        Retorna:
-            str: Acción validada.
-        Raises:
-            ValueError: Si la acción no es válida.
-        """
-        allowed = ['accept', 'reject', 'counter']
-        if v not in allowed:
-            raise ValueError(f"Acción debe ser una de: {', '.join(allowed)}")
-        return v
-
     @model_validator(mode='after')
     def validate_action_requirements(self):
         """
@@ -124,12 +104,7 @@ class OfferRead(OfferBase):
     listing_title: Optional[str] = None
     listing_original_price: Optional[Decimal] = None
     
-    @field_serializer('buyer_id', 'seller_id')
-    def serialize_uuid(self, value: UUID) -> str:
-        return str(value)
-    
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OfferCardRead(BaseModel):
@@ -148,14 +123,8 @@ class OfferCardRead(BaseModel):
     # Información contextual según el usuario
     other_party_name: Optional[str] = None  # Nombre del comprador o vendedor
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class OfferListResponse(BaseModel):
+class OfferListResponse(PaginatedListMixin, PaginatedBase[OfferCardRead]):
     """Schema de respuesta para listado paginado de ofertas."""
-    
-    total: int = Field(..., description="Total de resultados")
-    page: int = Field(..., description="Página actual")
-    page_size: int = Field(..., description="Tamaño de página")
-    items: list[OfferCardRead] = Field(..., description="Lista de ofertas")
\ No newline at end of file
@@ -17,10 +17,11 @@ from typing import List, Optional, Union
 from pydantic import BaseModel, Field, ConfigDict, computed_field, field_validator
 
 from app.models.order import OrderStatusEnum
+from app.schemas.base import PaginatedBase, PaginatedListMixin, TrustedReadMixin
 
 # --- Schemas de Soporte ---
 
-class ListingBasic(BaseModel):
+class ListingBasic(TrustedReadMixin, BaseModel):
     """
     Schema básico para mostrar información del listing en un OrderItem.
     Evita cargar el modelo completo de Listing.
@@ -44,17 +45,15 @@ class ListingBasic(BaseModel):
             ListingBasic: Instancia con los datos básicos del listing.
         """
         primary_image = listing.get_primary_image() if listing else None
-        return cls(
-            listing_id=listing.listing_id,
-            title=listing.title,
-            seller_id=listing.seller_id,
+        return cls.from_orm_trusted(
+            listing,
             primary_image_url=primary_image.image_url if primary_image else None
         )
     
     model_config = ConfigDict(from_attributes=True)
 
 
-class BuyerBasic(BaseModel):
+class BuyerBasic(TrustedReadMixin, BaseModel):
     """
     Schema básico para mostrar información del comprador en una orden.
     """
@@ -67,7 +66,7 @@ class BuyerBasic(BaseModel):
 
 # --- Schemas de OrderItem ---
 
-class OrderItemRead(BaseModel):
+class OrderItemRead(TrustedReadMixin, BaseModel):
     """
     Schema para leer un ítem de una orden (histórico).
     """
@@ -93,19 +92,14 @@ class OrderItemRead(BaseModel):
             OrderItemRead: Instancia con los datos del ítem de orden.
         """
         listing_basic = ListingBasic.from_listing(order_item.listing) if order_item.listing else None
-        return cls(
-            order_item_id=order_item.order_item_id,
-            quantity=order_item.quantity,
-            price_at_purchase=order_item.price_at_purchase,
-            listing=listing_basic
-        )
+        return cls.from_orm_trusted(order_item, listing=listing_basic)
     
     model_config = ConfigDict(from_attributes=True)
 
 
 # --- Schemas de Order ---
 
-class OrderRead(BaseModel):
+class OrderRead(TrustedReadMixin, BaseModel):
     """
     Schema de respuesta para una orden (compra o venta).
     """
@@ -151,33 +145,17 @@ class OrderRead(BaseModel):
         # Incluir buyer si está cargado (para ventas)
         buyer_data = None
         if hasattr(order, 'buyer') and order.buyer:
-            buyer_data = BuyerBasic.model_validate(order.buyer)
+            buyer_data = BuyerBasic.from_orm_trusted(order.buyer)
         
-        return cls(
-            order_id=order.order_id,
-            buyer_id=order.buyer_id,
-            buyer=buyer_data,
-            created_at=order.created_at,
-            subtotal=order.subtotal,
-            commission_amount=order.commission_amount,
-            total_amount=order.total_amount,
-            order_status=order.order_status,
-            payment_method=order.payment_method,
-            payment_charge_id=order.payment_charge_id,
-            order_items=order_items
-        )
+        return cls.from_orm_trusted(order, buyer=buyer_data, order_items=order_items)
     
     model_config = ConfigDict(from_attributes=True)
 
 
-class OrderList(BaseModel):
+class OrderList(PaginatedListMixin, PaginatedBase[OrderRead]):
     """
     Schema para respuestas paginadas de listas de órdenes.
     """
-    items: List[OrderRead]
-    total: int = Field(..., ge=0, description="Total de órdenes encontradas")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, description="Items por página")
 
 
 # --- Schemas de Checkout (Request) ---
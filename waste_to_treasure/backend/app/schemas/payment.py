@@ -8,9 +8,10 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict, computed_field
 
 from app.models.payment_enums import PaymentGatewayEnum, PaymentStatusEnum
+from app.schemas.base import CurrencyStr, Money, PaginatedBase, PaginatedListMixin
 
 
 class PaymentTransactionBase(BaseModel):
@@ -25,27 +26,19 @@ class PaymentTransactionBase(BaseModel):
         description="Pasarela de pago utilizada"
     )
     
-    amount: Decimal = Field(
+    amount: Money = Field(
         ...,
-        gt=0,
-        decimal_places=2,
         description="Monto total del pago",
         examples=[Decimal("110.00")]
     )
     
-    currency: str = Field(
+    currency: CurrencyStr = Field(
         default="MXN",
-        min_length=3,
-        max_length=3,
         description="Código de moneda ISO 4217",
         examples=["MXN", "USD"]
     )
-    
-    @field_validator("currency")
-    @classmethod
-    def validate_currency_uppercase(cls, v: str) -> str:
-        """Valida que la moneda esté en mayúsculas."""
-        return v.upper()
+
+    model_config = ConfigDict(defer_build=True)
 
 
 class PaymentTransactionCreate(PaymentTransactionBase):
@@ -144,6 +137,8 @@ class PaymentTransactionUpdate(BaseModel):
         description="Metadata adicional en JSON"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PaymentTransactionInDB(PaymentTransactionBase):
     """
@@ -171,7 +166,12 @@ class PaymentTransactionInDB(PaymentTransactionBase):
     
     error_code: Optional[str] = None
     error_message: Optional[str] = None
-    metadata: Optional[str] = None
+    # En el modelo la columna es `transaction_metadata` (`metadata` está
+    # reservado por SQLAlchemy y leerlo da el MetaData de la tabla)
+    metadata: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("transaction_metadata", "metadata")
+    )
     
     created_at: datetime
     updated_at: datetime
@@ -205,55 +205,37 @@ class PaymentTransactionRead(PaymentTransactionInDB):
 
     Usado en: GET endpoints
     """
-    # Campos computados opcionales
-    formatted_amount: Optional[str] = Field(
-        None,
-        description="Monto formateado con moneda"
-    )
-    
-    masked_payment_method: Optional[str] = Field(
-        None,
-        description="Método de pago enmascarado"
-    )
-    
-    is_successful: bool = Field(
-        default=False,
-        description="Si la transacción fue exitosa"
-    )
+    # DTO de respuesta: inmutable una vez construido
+    model_config = ConfigDict(frozen=True)
+
+    @computed_field(description="Monto formateado con moneda")
+    @property
+    def formatted_amount(self) -> str:
+        """Monto con moneda (ej: "$110.00 MXN")."""
+        return f"${self.amount:.2f} {self.currency}"
 
+    @computed_field(description="Método de pago enmascarado")
+    @property
+    def masked_payment_method(self) -> Optional[str]:
+        """Últimos 4 dígitos enmascarados (ej: "•••• 4242") o None."""
+        if self.payment_method_last4:
+            return f"•••• {self.payment_method_last4}"
+        return None
 
-class PaymentTransactionList(BaseModel):
+    @computed_field(description="Si la transacción fue exitosa")
+    @property
+    def is_successful(self) -> bool:
+        """Verifica si la transacción está COMPLETED."""
+        return self.status == PaymentStatusEnum.COMPLETED
+
+
+class PaymentTransactionList(PaginatedListMixin, PaginatedBase[PaymentTransactionRead]):
     """
     Autor: Oscar Alonso Nava Rivera
     Descripción: Esquema de respuesta paginada para listar transacciones.
 
     Usado en: GET /payments/transactions
     """
-    items: list[PaymentTransactionRead] = Field(
-        ...,
-        description="Lista de transacciones"
-    )
-    
-    total: int = Field(
-        ...,
-        ge=0,
-        description="Total de transacciones"
-    )
-    
-    page: int = Field(
-        ...,
-        ge=1,
-        description="Página actual"
-    )
-    
-    page_size: int = Field(
-        ...,
-        ge=1,
-        le=100,
-        description="Items por página"
-    )
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentTransactionPublic(BaseModel):
@@ -272,4 +254,4 @@ class PaymentTransactionPublic(BaseModel):
     initiated_at: datetime
     completed_at: Optional[datetime] = None
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
\ No newline at end of file
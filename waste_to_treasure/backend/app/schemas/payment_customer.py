@@ -11,6 +11,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict
 
 from app.models.payment_enums import PaymentGatewayEnum
+from app.schemas.base import TrustedReadMixin
 
 
 class PaymentCustomerBase(BaseModel):
@@ -31,6 +32,8 @@ class PaymentCustomerBase(BaseModel):
         description="ID del customer en la pasarela"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PaymentCustomerCreate(PaymentCustomerBase):
     """
@@ -62,8 +65,10 @@ class PaymentCustomerUpdate(BaseModel):
         description="Nuevo método de pago predeterminado"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
-class PaymentCustomerInDB(PaymentCustomerBase):
+class PaymentCustomerInDB(TrustedReadMixin, PaymentCustomerBase):
     """\
     Autor: Oscar Alonso Nava Rivera
     Descripción: Esquema de PaymentCustomer en BD.
@@ -112,6 +117,8 @@ class PaymentMethodCreate(BaseModel):
         description="Marcar como método predeterminado"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PaymentMethodRead(BaseModel):
     """
@@ -162,6 +169,8 @@ class PaymentMethodRead(BaseModel):
         description="Fecha de creación"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PaymentMethodList(BaseModel):
     """\
@@ -180,4 +189,4 @@ class PaymentMethodList(BaseModel):
         description="Total de métodos"
     )
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
\ No newline at end of file
@@ -12,9 +12,10 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, computed_field
 
 from app.models.payment_enums import PayoutStatusEnum
+from app.schemas.base import CurrencyStr, Money, PaginatedBase, PaginatedListMixin
 
 
 class PayoutBase(BaseModel):
@@ -24,20 +25,18 @@ class PayoutBase(BaseModel):
     Esquema base para Payout.
     """
     
-    amount: Decimal = Field(
+    amount: Money = Field(
         ...,
-        gt=0,
-        decimal_places=2,
         description="Monto a transferir"
     )
     
-    currency: str = Field(
+    currency: CurrencyStr = Field(
         default="MXN",
-        min_length=3,
-        max_length=3,
         description="Moneda del payout"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PayoutCreate(PayoutBase):
     """
@@ -73,6 +72,8 @@ class PayoutApprove(BaseModel):
         description="Notas del admin sobre la aprobación"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PayoutReject(BaseModel):
     """
@@ -89,6 +90,8 @@ class PayoutReject(BaseModel):
         description="Razón del rechazo"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PayoutInDB(PayoutBase):
     """
@@ -123,53 +126,35 @@ class PayoutRead(PayoutInDB):
     
     Usado en: GET /sellers/payouts, GET /admin/payouts
     """
-    formatted_amount: Optional[str] = Field(
-        None,
-        description="Monto formateado"
-    )
-    
-    days_pending: Optional[int] = Field(
-        None,
-        description="Días desde solicitud"
-    )
-    
-    can_be_approved: bool = Field(
-        default=False,
-        description="Si puede ser aprobado"
-    )
 
+    @computed_field(description="Monto formateado")
+    @property
+    def formatted_amount(self) -> str:
+        """Monto con moneda (ej: "$850.00 MXN")."""
+        return f"${self.amount:.2f} {self.currency}"
+
+    @computed_field(description="Días desde solicitud")
+    @property
+    def days_pending(self) -> Optional[int]:
+        """Días transcurridos desde `initiated_at` mientras siga PENDING."""
+        if self.status != PayoutStatusEnum.PENDING:
+            return None
+        return (datetime.now(self.initiated_at.tzinfo) - self.initiated_at).days
+
+    @computed_field(description="Si puede ser aprobado")
+    @property
+    def can_be_approved(self) -> bool:
+        """Solo un payout PENDING puede ser aprobado."""
+        return self.status == PayoutStatusEnum.PENDING
 
-class PayoutList(BaseModel):
+
+class PayoutList(PaginatedListMixin, PaginatedBase[PayoutRead]):
     """
     Autor: Oscar Alonso Nava Rivera
 
     Lista paginada de payouts.
     """
-    
-    items: list[PayoutRead] = Field(
-        ...,
-        description="Lista de payouts"
-    )
-    
-    total: int = Field(
-        ...,
-        ge=0,
-        description="Total de payouts"
-    )
-    
-    page: int = Field(
-        ...,
-        ge=1,
-        description="Página actual"
-    )
-    
-    page_size: int = Field(
-        ...,
-        ge=1,
-        le=100,
-        description="Items por página"
-    )
-    
+
     # Estadísticas agregadas
     total_pending_amount: Optional[Decimal] = Field(
         None,
@@ -180,8 +165,6 @@ class PayoutList(BaseModel):
         None,
         description="Monto total pagado"
     )
-    
-    model_config = ConfigDict(from_attributes=True)
 
 
 class PayoutStats(BaseModel):
@@ -220,4 +203,6 @@ class PayoutStats(BaseModel):
     next_payout_date: Optional[datetime] = Field(
         None,
         description="Fecha estimada del próximo payout"
-    )
\ No newline at end of file
+    )
+
+    model_config = ConfigDict(defer_build=True)
\ No newline at end of file
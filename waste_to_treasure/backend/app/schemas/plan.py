@@ -7,11 +7,11 @@
 """
 Schemas Pydantic para el modelo Plan.
 """
-import json
 from decimal import Decimal
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, ConfigDict, computed_field
+import orjson
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr, computed_field, model_validator
 
 from app.models.plans import BillingCycle
 
@@ -29,28 +29,45 @@ class PlanRead(BaseModel):
     # Oculta el campo 'features_json' de la respuesta final
     features_json: Optional[str] = Field(None, exclude=True)
 
+    # Se parsea una vez al validar, no en cada serialización
+    _features: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    @model_validator(mode='after')
+    def _parse_features(self) -> "PlanRead":
+        """
+        Autor: Alejandro Campa Alonso 215833
+        Descripción: Analiza la cadena JSON de 'features_json' una sola vez al validar.
+        Parámetros:
+            Ninguno (usa self).
+        Retorna:
+            PlanRead: La misma instancia con las características ya parseadas.
+        """
+        if self.features_json:
+            try:
+                self._features = orjson.loads(self.features_json)
+            except orjson.JSONDecodeError:
+                self._features = None
+        return self
+
     @computed_field
     @property
     def features(self) -> Optional[Dict[str, Any]]:
         """
         Autor: Alejandro Campa Alonso 215833
-        Descripción: Analiza la cadena JSON de 'features_json' y la devuelve como un diccionario.
+        Descripción: Devuelve las características del plan parseadas desde 'features_json'.
         Parámetros:
             Ninguno (propiedad computada).
         Retorna:
             Optional[Dict[str, Any]]: Diccionario con las características del plan o None si hay error.
         """
-        if self.features_json:
-            try:
-                return json.loads(self.features_json)
-            except json.JSONDecodeError:
-                return None
-        return None
+        return self._features
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 class PlanList(BaseModel):
     """
     Schema para la respuesta de la lista de planes.
     """
-    items: List[PlanRead]
\ No newline at end of file
+    items: List[PlanRead]
+
+    model_config = ConfigDict(defer_build=True)
\ No newline at end of file
@@ -9,12 +9,29 @@ Esquemas de Pydantic para el modelo Report.
 Define los contratos de entrada y salida para el sistema de reportes
 de usuarios sobre contenido, otros usuarios u órdenes.
 """
-from typing import Optional
+from typing import Annotated, Optional
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, StringConstraints, field_validator
 from enum import Enum
 
+from app.schemas.base import PaginatedBase, PaginatedListMixin
+
+
+def _description_not_blank(v: str) -> str:
+    """
+    Valida que la descripción no sea vacía ni solo espacios.
+
+    Va dentro del tipo y no como field_validator para que un `None` no
+    llegue a Python.
+    """
+    if not v or v.isspace():
+        raise ValueError("La descripción no puede estar vacía")
+    return v
+
+
+DescriptionStr = Annotated[str, StringConstraints(max_length=1000), AfterValidator(_description_not_blank)]
+
 
 class ReportReason(str, Enum):
     """Razones predefinidas para reportes."""
@@ -39,16 +56,16 @@ class ReportBase(BaseModel):
     """
     Esquema base con campos comunes para Report.
 
-    Contiene los campos que se usan en creación.
+    Contiene los campos que se usan en creación. `use_enum_values` guarda
+    `reason` como su string, que es lo que se escribe en la columna.
     """
-    reason: str = Field(
+    reason: ReportReason = Field(
         ...,
         description="Razón del reporte (predefinida)",
         examples=["inappropriate_content", "fraud", "spam"]
     )
-    description: Optional[str] = Field(
+    description: Optional[DescriptionStr] = Field(
         None,
-        max_length=1000,
         description="Descripción detallada del reporte",
         examples=["Esta publicación contiene imágenes inapropiadas y engañosas"]
     )
@@ -65,13 +82,7 @@ class ReportBase(BaseModel):
         description="ID de la orden reportada (si aplica)"
     )
 
-    @field_validator("description")
-    @classmethod
-    def validate_description_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        """Valida que la descripción no sea solo espacios en blanco."""
-        if v is not None and v.strip() == "":
-            raise ValueError("La descripción no puede estar vacía")
-        return v
+    model_config = ConfigDict(use_enum_values=True, defer_build=True)
 
 
 class ReportCreate(ReportBase):
@@ -100,7 +111,10 @@ class ReportInDB(ReportBase):
     Esquema que representa cómo se almacena Report en la base de datos.
     
     Incluye campos autogenerados como ID, reporter_id y timestamps.
+    `reason` vuelve a ser `str`: la columna puede tener razones de texto
+    libre anteriores a `ReportReason`.
     """
+    reason: str = Field(..., description="Razón del reporte")
     report_id: int = Field(..., description="Identificador único del reporte")
     reporter_id: UUID = Field(..., description="UUID del usuario que reporta")
     status: ReportStatus = Field(
@@ -122,10 +136,7 @@ class ReportInDB(ReportBase):
     created_at: datetime = Field(..., description="Fecha de creación")
     updated_at: datetime = Field(..., description="Última actualización")
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReportRead(BaseModel):
@@ -150,22 +161,17 @@ class ReportRead(BaseModel):
 
     model_config = ConfigDict(
         from_attributes=True,
-        populate_by_name=True
+        defer_build=True
     )
 
 
-class ReportList(BaseModel):
+class ReportList(PaginatedListMixin, PaginatedBase[ReportRead]):
     """
     Esquema de respuesta paginada para listar reportes del usuario.
     
     Usado en: GET /api/v1/reports/my-reports
     """
-    items: list[ReportRead] = Field(..., description="Lista de reportes")
-    total: int = Field(..., ge=0, description="Total de reportes del usuario")
-    page: int = Field(..., ge=1, description="Página actual")
-    page_size: int = Field(..., ge=1, le=100, description="Items por página")
-    
-    model_config = ConfigDict(from_attributes=True)
+
 
 class ReporterBasic(BaseModel):
     """Esquema simplificado del usuario que reporta."""
@@ -174,7 +180,7 @@ class ReporterBasic(BaseModel):
     first_name: str = Field(..., description="Nombre")
     last_name: str = Field(..., description="Apellido")
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class ReportWithReporter(ReportInDB):
@@ -211,4 +217,4 @@ class ReportStatistics(BaseModel):
         examples=[{"spam": 45, "fraud": 23, "inappropriate_content": 12}]
     )
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
\ No newline at end of file
@@ -8,12 +8,16 @@
 Schemas Pydantic para el modelo ShippingMethod.
 """
 import uuid
-from decimal import Decimal
 from datetime import datetime
-from typing import Optional, List
+from decimal import Decimal
+from typing import Annotated, Optional, List
 from pydantic import BaseModel, Field, ConfigDict
 
-from app.models.shipping_methods import ShippingTypeEnum
+from app.models.shipping_methods import MAX_COST, ShippingTypeEnum
+
+# El costo se guarda en centavos en una columna INTEGER, no en Numeric(10, 2):
+# el tope es el de la columna, así un costo mayor da 422 y no un overflow.
+ShippingCost = Annotated[Decimal, Field(ge=0, le=MAX_COST, decimal_places=2)]
 
 class ShippingMethodBase(BaseModel):
     """
@@ -26,10 +30,8 @@ class ShippingMethodBase(BaseModel):
         description="Nombre descriptivo del método de envío",
         examples=["Envío Estándar a Domicilio", "Recojo en Tienda"]
     )
-    cost: Decimal = Field(
+    cost: ShippingCost = Field(
         ...,
-        ge=0,
-        decimal_places=2,
         description="Costo del método de envío (0.00 para 'gratis' o 'recojo')",
         examples=[150.00, 0.00]
     )
@@ -57,10 +59,8 @@ class ShippingMethodUpdate(BaseModel):
         max_length=100,
         description="Nuevo nombre descriptivo"
     )
-    cost: Optional[Decimal] = Field(
+    cost: Optional[ShippingCost] = Field(
         None,
-        ge=0,
-        decimal_places=2,
         description="Nuevo costo del método"
     )
     type: Optional[ShippingTypeEnum] = Field(
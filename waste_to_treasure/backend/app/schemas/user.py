@@ -78,7 +78,8 @@ class UserRead(BaseModel):
         description="Última actualización del usuario"
     )
     
-    model_config = ConfigDict(from_attributes=True)
+    # DTO de respuesta: inmutable una vez construido
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserPublic(BaseModel):
@@ -105,7 +106,7 @@ class UserPublic(BaseModel):
     bio: Optional[str] = None
     role: UserRoleEnum
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ==========================================
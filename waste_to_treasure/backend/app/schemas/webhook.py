@@ -9,6 +9,8 @@ from decimal import Decimal
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.base import Money
+
 
 class StripeWebhookEvent(BaseModel):
     """
@@ -204,10 +206,8 @@ class RefundRequest(BaseModel):
         description="ID de la transacción a reembolsar"
     )
     
-    amount: Optional[Decimal] = Field(
+    amount: Optional[Money] = Field(
         None,
-        gt=0,
-        decimal_places=2,
         description="Monto a reembolsar (NULL = reembolso total)"
     )
     
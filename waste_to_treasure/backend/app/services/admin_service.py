@@ -11,11 +11,12 @@ Servicio para funcionalidades de administración.
 Contiene la lógica de negocio para moderación y estadísticas.
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, true
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Tuple
+import time
 import uuid
 
 from app.models.user import User, UserRoleEnum, UserStatusEnum
@@ -25,10 +26,33 @@ from app.models.reports import Report, ModerationStatus, ReportType
 from app.models.admin_action_logs import AdminActionLog
 from app.models.category import Category
 from app.schemas.admin import (
+    AdminActionLogRead,
     ListingModerationAction,
-    ReportResolution
+    ModerationListingList,
+    ModerationQueueItem,
+    ReportQueueItem,
+    ReportResolution,
+    StatsDashboard,
+    UserAdminList,
+    UserAdminListItem,
 )
 
+# Caché en proceso de get_dashboard_stats: (instante monotonic, resultado)
+_STATS_TTL_SECONDS = 30
+_stats_cache: Optional[Tuple[float, StatsDashboard]] = None
+
+
+def clear_stats_cache() -> None:
+    """
+    Descarta las estadísticas cacheadas del dashboard.
+
+    Lo llaman las acciones de moderación que cambian los conteos
+    (listings pendientes, reportes pendientes) para que el panel no muestre
+    valores viejos; los tests lo usan para empezar sin caché.
+    """
+    global _stats_cache
+    _stats_cache = None
+
 
 class AdminService:
     """
@@ -43,7 +67,7 @@ class AdminService:
         skip (int): Número de registros a omitir.
         limit (int): Número máximo de registros a retornar.
     Retorna:
-        Tuple[List[Dict], int]: Lista de usuarios y total de registros.
+        Tuple[List[UserAdminListItem], int]: Lista de usuarios y total de registros.
     """
     @staticmethod
     async def get_users_list(
@@ -53,12 +77,19 @@ class AdminService:
         search_term: Optional[str] = None,
         skip: int = 0,
         limit: int = 50
-    ) -> Tuple[List[Dict], int]:
+    ) -> Tuple[List[UserAdminListItem], int]:
         """Obtener lista de usuarios con filtros"""
         from sqlalchemy import or_
         
-        # Query base
-        stmt = select(User)
+        # Query base: solo las columnas de UserAdminListItem
+        stmt = select(
+            User.user_id,
+            User.email,
+            User.full_name,
+            User.role,
+            User.status,
+            User.created_at
+        )
         count_stmt = select(func.count(User.user_id))
         
         # Filtro por rol
@@ -96,19 +127,9 @@ class AdminService:
         stmt = stmt.order_by(User.created_at.desc()).offset(skip).limit(limit)
         
         result = await db.execute(stmt)
-        users = result.scalars().all()
         
-        # Formatear respuesta
-        items = []
-        for user in users:
-            items.append({
-                "user_id": user.user_id,
-                "email": user.email,
-                "full_name": user.full_name,
-                "role": user.role,
-                "status": user.status,
-                "created_at": user.created_at
-            })
+        # Validar todas las filas en una sola llamada a pydantic-core
+        items = UserAdminList.items_adapter().validate_python(result.all())
         
         return items, total
     
@@ -119,74 +140,63 @@ class AdminService:
     Parámetros:
         db (AsyncSession): Sesión de base de datos asíncrona.
     Retorna:
-        Dict: Estadísticas de usuarios, listings, órdenes, reportes y revenue.
+        StatsDashboard: Estadísticas de usuarios, listings, órdenes, reportes y revenue.
     """
 
     @staticmethod
-    async def get_dashboard_stats(db: AsyncSession) -> Dict:
-        """Obtener estadísticas generales del dashboard"""
-        
-        # Total usuarios
-        total_users_stmt = select(func.count(User.user_id))
-        total_users = await db.scalar(total_users_stmt) or 0
-        
-        # Usuarios activos
-        active_users_stmt = select(func.count(User.user_id)).where(
-            User.status == UserStatusEnum.ACTIVE
-        )
-        active_users = await db.scalar(active_users_stmt) or 0
-        
-        # Total listings
-        total_listings_stmt = select(func.count(Listing.listing_id))
-        total_listings = await db.scalar(total_listings_stmt) or 0
-        
-        # Listings por estado
-        pending_listings_stmt = select(func.count(Listing.listing_id)).where(
-            Listing.status == ListingStatusEnum.PENDING
-        )
-        pending_listings = await db.scalar(pending_listings_stmt) or 0
-        
-        approved_listings_stmt = select(func.count(Listing.listing_id)).where(
-            Listing.status == ListingStatusEnum.ACTIVE
-        )
-        approved_listings = await db.scalar(approved_listings_stmt) or 0
-        
-        rejected_listings_stmt = select(func.count(Listing.listing_id)).where(
-            Listing.status == ListingStatusEnum.REJECTED
-        )
-        rejected_listings = await db.scalar(rejected_listings_stmt) or 0
-        
-        # Total órdenes
-        total_orders_stmt = select(func.count(Order.order_id))
-        total_orders = await db.scalar(total_orders_stmt) or 0
-        
-        # Reportes pendientes
-        pending_reports_stmt = select(func.count(Report.report_id)).where(
-            Report.status == ModerationStatus.PENDING
-        )
-        pending_reports = await db.scalar(pending_reports_stmt) or 0
-        
-        # Revenue total (órdenes pagadas, enviadas y entregadas - excluyendo canceladas y reembolsadas)
-        total_revenue_stmt = select(func.sum(Order.total_amount)).where(
-            Order.order_status.in_([
-                OrderStatusEnum.PAID,
-                OrderStatusEnum.SHIPPED,
-                OrderStatusEnum.DELIVERED
-            ])
+    async def get_dashboard_stats(db: AsyncSession) -> StatsDashboard:
+        """
+        Obtener estadísticas generales del dashboard.
+
+        Una sola query: una subconsulta de una fila por tabla, con los
+        conteos por estado como agregados FILTER. El resultado se guarda
+        en memoria _STATS_TTL_SECONDS para que el polling del panel no
+        vuelva a escanear las tablas en cada request; las acciones de
+        moderación lo descartan con clear_stats_cache().
+        """
+        global _stats_cache
+        now = time.monotonic()
+        if _stats_cache is not None and now - _stats_cache[0] < _STATS_TTL_SECONDS:
+            return _stats_cache[1]
+
+        users = select(
+            func.count().label("total_users"),
+            func.count().filter(User.status == UserStatusEnum.ACTIVE).label("active_users"),
+        ).subquery()
+        listings = select(
+            func.count().label("total_listings"),
+            func.count().filter(Listing.status == ListingStatusEnum.PENDING).label("pending_listings"),
+            func.count().filter(Listing.status == ListingStatusEnum.ACTIVE).label("approved_listings"),
+            func.count().filter(Listing.status == ListingStatusEnum.REJECTED).label("rejected_listings"),
+        ).subquery()
+        # Revenue: órdenes pagadas, enviadas y entregadas (excluye canceladas y reembolsadas)
+        orders = select(
+            func.count().label("total_orders"),
+            func.coalesce(
+                func.sum(Order.total_amount).filter(
+                    Order.order_status.in_([
+                        OrderStatusEnum.PAID,
+                        OrderStatusEnum.SHIPPED,
+                        OrderStatusEnum.DELIVERED
+                    ])
+                ),
+                0
+            ).label("total_revenue"),
+        ).subquery()
+        reports = select(
+            func.count().filter(Report.status == ModerationStatus.PENDING).label("pending_reports"),
+        ).subquery()
+
+        stmt = select(users, listings, orders, reports).select_from(
+            users.join(listings, true()).join(orders, true()).join(reports, true())
         )
-        total_revenue = await db.scalar(total_revenue_stmt) or 0.0
-        
-        return {
-            "total_users": total_users,
-            "active_users": active_users,
-            "total_listings": total_listings,
-            "pending_listings": pending_listings,
-            "approved_listings": approved_listings,
-            "rejected_listings": rejected_listings,
-            "total_orders": total_orders,
-            "pending_reports": pending_reports,
-            "total_revenue": float(total_revenue)
-        }
+        row = (await db.execute(stmt)).one()._asdict()
+        row["total_revenue"] = float(row["total_revenue"])
+
+        # Conteos de la BD: ya cumplen ge=0, se construye sin revalidar
+        stats = StatsDashboard.model_construct(**row)
+        _stats_cache = (now, stats)
+        return stats
     
     """
     Autor: Gabriel Florentino Reyes
@@ -419,7 +429,7 @@ class AdminService:
         skip (int): Número de registros a omitir.
         limit (int): Número máximo de registros a retornar.
     Retorna:
-        Tuple[List[Dict], int]: Lista de listings y total de registros.
+        Tuple[List[ModerationQueueItem], int]: Lista de listings y total de registros.
     """
     
     @staticmethod
@@ -428,13 +438,24 @@ class AdminService:
         status_filter: Optional[str] = None,
         skip: int = 0,
         limit: int = 50
-    ) -> Tuple[List[Dict], int]:
+    ) -> Tuple[List[ModerationQueueItem], int]:
         """Obtener cola de moderación de listings"""
         
-        # Query base con eager loading
-        stmt = select(Listing).options(
-            selectinload(Listing.seller),
-            selectinload(Listing.category)
+        # Query base: solo las columnas de ModerationQueueItem
+        stmt = (
+            select(
+                Listing.listing_id,
+                Listing.title,
+                Listing.seller_id,
+                func.coalesce(func.nullif(User.full_name, ""), User.email).label("seller_name"),
+                func.coalesce(Category.name, "Sin categoría").label("category_name"),
+                Listing.price,
+                Listing.status,
+                Listing.created_at,
+                Listing.updated_at.label("submitted_at")
+            )
+            .join(User, Listing.seller_id == User.user_id)
+            .outerjoin(Category, Listing.category_id == Category.category_id)
         )
         
         # Filtro por estado
@@ -460,31 +481,10 @@ class AdminService:
         stmt = stmt.order_by(Listing.created_at.desc()).offset(skip).limit(limit)
         
         result = await db.execute(stmt)
-        listings = result.scalars().all()
         
-        # Formatear respuesta
-        items = []
-        for listing in listings:
-            # Mapear status del modelo al schema (usar MAYÚSCULAS para ModerationStatus enum)
-            schema_status = "PENDING"
-            if listing.status == ListingStatusEnum.ACTIVE:
-                schema_status = "ACTIVE"
-            elif listing.status == ListingStatusEnum.REJECTED:
-                schema_status = "REJECTED"
-            elif listing.status == ListingStatusEnum.INACTIVE:
-                schema_status = "INACTIVE"
-            
-            items.append({
-                "listing_id": listing.listing_id,
-                "title": listing.title,
-                "seller_id": listing.seller_id,
-                "seller_name": listing.seller.full_name or listing.seller.email,
-                "category_name": listing.category.name if listing.category else "Sin categoría",
-                "price": float(listing.price),
-                "status": schema_status,
-                "created_at": listing.created_at,
-                "submitted_at": listing.updated_at
-            })
+        # ListingStatusEnum y ModerationStatus comparten valores (PENDING,
+        # ACTIVE, REJECTED, INACTIVE); el BeforeValidator del schema toma .value
+        items = ModerationListingList.items_adapter().validate_python(result.all())
         
         return items, total
     
@@ -542,6 +542,7 @@ class AdminService:
         db.add(action_log)
         
         await db.commit()
+        clear_stats_cache()
         await db.refresh(listing)
         await db.refresh(action_log)
         
@@ -612,6 +613,7 @@ class AdminService:
         db.add(action_log)
         
         await db.commit()
+        clear_stats_cache()
         await db.refresh(listing)
         await db.refresh(action_log)
         
@@ -632,7 +634,7 @@ class AdminService:
         skip (int): Número de registros a omitir.
         limit (int): Número máximo de registros a retornar.
     Retorna:
-        Tuple[List[Dict], int]: Lista de reportes y total de registros.
+        Tuple[List[ReportQueueItem], int]: Lista de reportes y total de registros.
     """
     
     @staticmethod
@@ -641,7 +643,7 @@ class AdminService:
         status_filter: Optional[str] = None,
         skip: int = 0,
         limit: int = 50
-    ) -> Tuple[List[Dict], int]:
+    ) -> Tuple[List[ReportQueueItem], int]:
         """Obtener cola de reportes"""
         
         # Query base con eager loading
@@ -685,18 +687,16 @@ class AdminService:
             entity_type = report.report_type.value
             entity_desc = f"{entity_type.capitalize()} ID: {entity_id}"
             
-            items.append({
-                "report_id": report.report_id,
-                "reporter_id": report.reporter_user_id,
-                "reporter_name": report.reporter.full_name or report.reporter.email,
-                "report_type": entity_type,
-                "reported_entity_id": entity_id,
-                "reported_entity_description": entity_desc,
-                "reason": report.reason,
-                "description": report.details,
-                "status": report.status.value,
-                "created_at": report.created_at
-            })
+            items.append(ReportQueueItem.from_orm_trusted(
+                report,
+                reporter_id=report.reporter_user_id,
+                reporter_name=report.reporter.full_name or report.reporter.email,
+                report_type=entity_type,
+                reported_entity_id=entity_id,
+                reported_entity_description=entity_desc,
+                description=report.details,
+                status=report.status.value
+            ))
         
         return items, total
     
@@ -761,6 +761,7 @@ class AdminService:
         db.add(action_log)
         
         await db.commit()
+        clear_stats_cache()
         await db.refresh(report)
         await db.refresh(action_log)
         
@@ -781,7 +782,7 @@ class AdminService:
         skip (int): Número de registros a omitir.
         limit (int): Número máximo de registros a retornar.
     Retorna:
-        Tuple[List[Dict], int]: Lista de logs y total de registros.
+        Tuple[List[AdminActionLogRead], int]: Lista de logs y total de registros.
     """
 
     @staticmethod
@@ -790,7 +791,7 @@ class AdminService:
         action_type_filter: Optional[str] = None,
         skip: int = 0,
         limit: int = 50
-    ) -> Tuple[List[Dict], int]:
+    ) -> Tuple[List[AdminActionLogRead], int]:
         """Obtener logs de acciones administrativas"""
         
         # Query base con eager loading
@@ -816,17 +817,14 @@ class AdminService:
         logs = result.scalars().all()
         
         # Formatear respuesta
-        items = []
-        for log in logs:
-            items.append({
-                "log_id": log.log_id,
-                "admin_id": log.admin_id,
-                "admin_name": log.admin.full_name or log.admin.email if log.admin else "System",
-                "action_type": log.action_type,
-                "target_type": log.target_entity_type,
-                "target_id": log.target_entity_id,
-                "reason": log.reason,
-                "created_at": log.created_at
-            })
+        items = [
+            AdminActionLogRead.from_orm_trusted(
+                log,
+                admin_name=log.admin.full_name or log.admin.email if log.admin else "System",
+                target_type=log.target_entity_type,
+                target_id=log.target_entity_id
+            )
+            for log in logs
+        ]
         
         return items, total
\ No newline at end of file
@@ -13,8 +13,9 @@ incluyendo validaciones de stock y cálculos de totales.
 Este servicio está completamente asíncrono para aprovechar la arquitectura
 de FastAPI y SQLAlchemy 2.0 async, mejorando el rendimiento y escalabilidad.
 """
+from functools import lru_cache
 from typing import Optional, Tuple
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,7 +25,24 @@ from fastapi import HTTPException, status
 
 from app.models.cart import Cart, CartItem
 from app.models.listing import Listing, ListingStatusEnum
-from app.schemas.cart import CartItemCreate, CartItemUpdate, CartItemRead
+from app.schemas.cart import CartItemCreate, CartItemUpdate, CartItemRead, CartRead
+
+# Comisión de la plataforma en puntos base: 1000 = 10% según SRS
+COMMISSION_BPS = 1000
+
+
+# Los precios y subtotales se repiten entre carritos (mismo listing en
+# varios carritos); Decimal es inmutable, así que el resultado se comparte.
+@lru_cache(maxsize=512)
+def _to_cents(amount: Decimal) -> int:
+    """Convierte un monto Decimal a centavos enteros (redondeo half-up)."""
+    return int(amount.scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=512)
+def _from_cents(cents: int) -> Decimal:
+    """Convierte centavos enteros a Decimal con dos decimales."""
+    return Decimal(cents).scaleb(-2)
 
 
 async def get_or_create_cart(db: AsyncSession, user_id: UUID) -> Cart:
@@ -356,57 +374,57 @@ async def validate_cart_for_checkout(
     return True, None
 
 
-def convert_cart_to_response(cart: Cart) -> dict:
+def convert_cart_to_response(cart: Cart) -> CartRead:
     """
     Autor: Arturo Perez Gonzalez
     Descripción: Convierte un objeto Cart de SQLAlchemy a formato CartRead con cálculos de totales.
+    Los datos vienen de la BD, así que se construye sin revalidar (from_orm_trusted).
+    Los totales se acumulan en centavos enteros en una sola pasada sobre los
+    items y se convierten a Decimal solo al armar la respuesta.
     Parámetros:
         cart (Cart): Objeto Cart de SQLAlchemy con items cargados.
     Retorna:
-        dict: Diccionario con datos formateados para schema CartRead, incluyendo subtotales y comisiones.
+        CartRead: Carrito con items, subtotales y comisiones.
     """
     items_data = []
+    total_items = 0
+    subtotal_cents = 0
+    has_unavailable_items = False
 
     for item in cart.items:
         listing = item.listing
+        is_available = listing is not None and listing.is_available()
 
         # Obtener imagen principal del listing
         listing_image = None
-        if listing and listing.get_primary_image():
-            listing_image = listing.get_primary_image().image_url
-
-        item_data = {
-            "cart_item_id": item.cart_item_id,
-            "cart_id": item.cart_id,
-            "listing_id": item.listing_id,
-            "quantity": item.quantity,
-            "created_at": item.created_at,
-            "updated_at": item.updated_at,
-            "listing_title": listing.title if listing else None,
-            "listing_price": listing.price if listing else None,
-            "listing_price_unit": listing.price_unit if listing else None,
-            "listing_image_url": str(listing_image) if listing_image else None,
-            "listing_available_quantity": listing.quantity if listing else None,
-            "listing_is_available": listing.is_available() if listing else False,
-            "item_subtotal": item.get_item_subtotal()
-        }
-
-        items_data.append(CartItemRead(**item_data))
-
-    subtotal = cart.get_subtotal()
-    commission_rate = Decimal("0.10")  # 10% según SRS
-    estimated_commission = subtotal * commission_rate
-    estimated_total = subtotal + estimated_commission
-
-    return {
-        "cart_id": cart.cart_id,
-        "user_id": cart.user_id,
-        "created_at": cart.created_at,
-        "updated_at": cart.updated_at,
-        "items": items_data,
-        "total_items": cart.get_total_items(),
-        "subtotal": subtotal,
-        "estimated_commission": estimated_commission,
-        "estimated_total": estimated_total,
-        "has_unavailable_items": cart.has_unavailable_items()
-    }
+        primary_image = listing.get_primary_image() if listing else None
+        if primary_image:
+            listing_image = primary_image.image_url
+
+        item_cents = _to_cents(listing.price) * item.quantity if is_available else 0
+        total_items += item.quantity
+        subtotal_cents += item_cents
+        has_unavailable_items = has_unavailable_items or not is_available
+
+        items_data.append(CartItemRead.from_orm_trusted(
+            item,
+            listing_title=listing.title if listing else None,
+            listing_price=listing.price if listing else None,
+            listing_price_unit=listing.price_unit if listing else None,
+            listing_image_url=str(listing_image) if listing_image else None,
+            listing_available_quantity=listing.quantity if listing else None,
+            listing_is_available=is_available,
+            item_subtotal=_from_cents(item_cents)
+        ))
+
+    commission_cents = (subtotal_cents * COMMISSION_BPS + 5_000) // 10_000
+
+    return CartRead.from_orm_trusted(
+        cart,
+        items=items_data,
+        total_items=total_items,
+        subtotal=_from_cents(subtotal_cents),
+        estimated_commission=_from_cents(commission_cents),
+        estimated_total=_from_cents(subtotal_cents + commission_cents),
+        has_unavailable_items=has_unavailable_items
+    )
@@ -24,6 +24,22 @@ from app.schemas.category import CategoryCreate, CategoryUpdate
 
 logger = logging.getLogger(__name__)
 
+# Patrones de generate_slug, compilados una sola vez al importar
+_SLUG_INVALID_CHARS = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATORS = re.compile(r'[-\s]+')
+
+# Columnas que expone cada nodo de GET /categories/tree
+_TREE_COLUMNS = (
+    Category.category_id,
+    Category.name,
+    Category.slug,
+    Category.type,
+    Category.parent_category_id,
+    Category.full_path,
+    Category.created_at,
+    Category.updated_at,
+)
+
 
 def generate_slug(name: str) -> str:
     """
@@ -45,8 +61,8 @@ def generate_slug(name: str) -> str:
     slug = name.lower()
     
     # Reemplazar espacios y caracteres especiales por guiones
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = _SLUG_INVALID_CHARS.sub('', slug)
+    slug = _SLUG_SEPARATORS.sub('-', slug)
     
     # Eliminar guiones al inicio y final
     slug = slug.strip('-')
@@ -245,6 +261,13 @@ async def create_category(db: AsyncSession, category_data: CategoryCreate) -> Ca
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Error de integridad en la base de datos"
             )
+    except ValueError as e:
+        # Ruta de la jerarquía demasiado larga (ver app.models.category)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         await db.rollback()
         logger.error(f"Error inesperado al crear categoría: {type(e).__name__}: {e}")
@@ -407,6 +430,13 @@ async def update_category(
         await db.refresh(category)
         logger.info(f"Categoría {category_id} actualizada exitosamente")
         return category
+    except ValueError as e:
+        # Ruta de la jerarquía demasiado larga (ver app.models.category)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         await db.rollback()
         logger.error(f"Error al actualizar categoría: {e}")
@@ -483,68 +513,42 @@ async def get_category_tree(db: AsyncSession) -> dict:
     """
     Autor: Oscar Alonso Nava Rivera
     Descripción: Construye y devuelve el árbol jerárquico completo de categorías por tipo.
-    Construye el árbol jerárquico completo de categorías.
     
-    Utiliza eager loading (selectinload) para cargar recursivamente todas
-    las subcategorías en una sola consulta, evitando el problema N+1.
+    Trae todas las categorías en una sola query de columnas (sin instancias
+    ORM) y arma el árbol en memoria con una lista de adyacencia, sin límite
+    de profundidad y sin lazy loading.
     
     Args:
         db: Sesión asíncrona de base de datos.
         
     Returns:
         Diccionario con dos árboles: 'materials' y 'products'.
-        Cada categoría incluye sus hijos cargados recursivamente.
-        
-    Note:
-        Esta implementación es significativamente más eficiente que lazy loading,
-        especialmente con jerarquías profundas. En lugar de N+1 queries, hace
-        solo 2 queries (una por cada tipo).
+        Cada nodo es un dict con las columnas de la categoría (incluida
+        la columna desnormalizada 'full_path') y la lista 'children',
+        ordenados por nombre.
         
     Example:
         {
-            "materials": [Category(...)],  # con children cargados
-            "products": [Category(...)]     # con children cargados
+            "materials": [{"category_id": 1, "name": "Madera", "children": [...]}],
+            "products": [...]
         }
     """
-    # Definir recursive eager loading para children
-    # Esto carga toda la jerarquía en una sola query por tipo
-    children_loader = selectinload(Category.children).options(
-        selectinload(Category.children).options(
-            selectinload(Category.children)  # 3 niveles de profundidad
-        )
-    )
-    
-    # Query para MATERIALS (solo raíz con hijos cargados recursivamente)
-    materials_stmt = (
-        select(Category)
-        .where(
-            and_(
-                Category.type == ListingTypeEnum.MATERIAL,
-                Category.parent_category_id.is_(None)
-            )
-        )
-        .options(children_loader)
-        .order_by(Category.name)
-    )
-    materials_result = await db.execute(materials_stmt)
-    materials_root = materials_result.scalars().all()
-    
-    # Query para PRODUCTS (solo raíz con hijos cargados recursivamente)
-    products_stmt = (
-        select(Category)
-        .where(
-            and_(
-                Category.type == ListingTypeEnum.PRODUCT,
-                Category.parent_category_id.is_(None)
-            )
-        )
-        .options(children_loader)
-        .order_by(Category.name)
-    )
-    products_result = await db.execute(products_stmt)
-    products_root = products_result.scalars().all()
+    stmt = select(*_TREE_COLUMNS).order_by(Category.name)
+    result = await db.execute(stmt)
+    nodes = {
+        row["category_id"]: {**row, "children": []}
+        for row in result.mappings()
+    }
+    
+    tree = {ListingTypeEnum.MATERIAL: [], ListingTypeEnum.PRODUCT: []}
+    for node in nodes.values():
+        parent = nodes.get(node["parent_category_id"])
+        if parent is None:
+            tree[node["type"]].append(node)
+        else:
+            parent["children"].append(node)
     
     return {
-        "materials": list(materials_root),
-        "products": list(products_root)
-    }
\ No newline at end of file
+        "materials": tree[ListingTypeEnum.MATERIAL],
+        "products": tree[ListingTypeEnum.PRODUCT]
+    }
@@ -30,6 +30,7 @@ from app.models.user import User, UserStatusEnum
 from app.schemas.listing import (
     ListingCreate, ListingUpdate, ListingStatusUpdate
 )
+from app.schemas.user import UserPublic
 from app.services.aws_s3_service import S3Service
 
 logger = logging.getLogger(__name__)
@@ -487,18 +488,20 @@ def convert_to_card_response(listing: Listing) -> dict:
         listing: Objeto Listing de SQLAlchemy.
 
     Returns:
-        Diccionario con formato para ListingCardRead.
+        Diccionario con formato para ListingCardRead. Los valores ya tienen
+        su tipo final (el vendedor como UserPublic), así que se puede pasar
+        a `ListingCardRead.model_construct` sin revalidar.
     """
     # Obtener imagen principal
     primary_image = None
     if listing.images:
         for img in listing.images:
             if img.is_primary:
-                primary_image = str(img.image_url)
+                primary_image = img.image_url
                 break
         # Si no hay imagen marcada como principal, usar la primera
         if not primary_image:
-            primary_image = str(listing.images[0].image_url)
+            primary_image = listing.images[0].image_url
 
     return {
         "listing_id": listing.listing_id,
@@ -509,7 +512,7 @@ def convert_to_card_response(listing: Listing) -> dict:
         "status": listing.status,
         "primary_image_url": primary_image,
         "seller_id": listing.seller_id,
-        "seller": listing.seller,
+        "seller": UserPublic.model_validate(listing.seller) if listing.seller else None,
         "seller_name": listing.seller.full_name if listing.seller else None,
         "category_name": listing.category.name if listing.category else None,
         "quantity": listing.quantity,
@@ -348,7 +348,8 @@ def convert_to_card_response(offer: Offer, current_user_id: UUID) -> dict:
         current_user_id: UUID del usuario actual (para contexto).
 
     Returns:
-        Diccionario con datos para OfferCardRead.
+        Diccionario con datos para OfferCardRead, con los valores ya en su
+        tipo final para usarse con `OfferCardRead.model_construct`.
     """
     # Determinar el "otro participante" según el contexto
     if current_user_id == offer.buyer_id:
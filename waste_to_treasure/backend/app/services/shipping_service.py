@@ -82,7 +82,7 @@ class ShippingService:
         stmt = (
             select(ShippingMethod)
             .where(ShippingMethod.seller_id == user.user_id)
-            .order_by(ShippingMethod.cost.asc())
+            .order_by(ShippingMethod.cost_cents.asc())
         )
         result = await db.execute(stmt)
         return list(result.scalars().all())
@@ -18,7 +18,6 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
 from app.models.user import User
@@ -67,7 +66,6 @@ class SubscriptionService:
                 Subscription.user_id == user.user_id,
                 Subscription.status == SubscriptionStatus.ACTIVE
             )
-            .options(selectinload(Subscription.plan)) # Eager load plan details
         )
         return result.scalar_one_or_none()
 
@@ -152,8 +150,7 @@ class SubscriptionService:
             existing_sub_same_plan.gateway_sub_id = simulated_gateway_sub_id
             
             await db.commit()
-            await db.refresh(existing_sub_same_plan)
-            await db.refresh(existing_sub_same_plan, attribute_names=["plan"])
+            await db.refresh(existing_sub_same_plan)  # Subscription.plan es lazy="joined"
             
             return existing_sub_same_plan
         else:
@@ -169,8 +166,7 @@ class SubscriptionService:
             db.add(new_subscription)
             
             await db.commit()
-            await db.refresh(new_subscription)
-            await db.refresh(new_subscription, attribute_names=["plan"])
+            await db.refresh(new_subscription)  # Subscription.plan es lazy="joined"
             
             return new_subscription
 
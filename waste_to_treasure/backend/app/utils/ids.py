@@ -0,0 +1,36 @@
+"""
+Generación de identificadores.
+
+Descripción: Generador de UUIDv7 (RFC 9562) para llaves primarias UUID.
+
+Un UUIDv7 guarda el timestamp en milisegundos en los 48 bits altos, por lo
+que los valores generados crecen con el tiempo: las inserciones caen en la
+página más a la derecha del índice B-tree en lugar de repartirse al azar
+como con uuid4.
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Genera un UUID versión 7 ordenado por tiempo.
+
+    Estructura (128 bits):
+        - 48 bits: timestamp Unix en milisegundos.
+        - 4 bits: versión (7).
+        - 12 bits: aleatorios.
+        - 2 bits: variante RFC 4122.
+        - 62 bits: aleatorios.
+
+    Returns:
+        UUID compatible con columnas UUID de PostgreSQL.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= rand & ~(0xF << 76) & ~(0x3 << 62)
+    value |= 0x7 << 76
+    value |= 0x2 << 62
+    return uuid.UUID(int=value)
@@ -0,0 +1,141 @@
+"""
+Tests para AdminService.get_dashboard_stats.
+
+Verifica que la consulta única con agregados FILTER coincide con los
+conteos por separado y que la caché se descarta al moderar.
+"""
+# Descripción: Tests de estadísticas del dashboard administrativo y su caché.
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_engine
+from app.models.category import Category, ListingTypeEnum
+from app.models.listing import Listing, ListingStatusEnum
+from app.models.order import Order, OrderStatusEnum
+from app.models.reports import ModerationStatus, Report
+from app.models.user import User, UserRoleEnum, UserStatusEnum
+from app.schemas.admin import ListingModerationAction, StatsDashboard
+from app.services import admin_service
+from app.services.admin_service import AdminService, clear_stats_cache
+
+
+@pytest_asyncio.fixture
+async def db():
+    """
+    Sesión asíncrona dentro de una transacción que se revierte al final.
+
+    Los commit del servicio se vuelven savepoints.
+    """
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        clear_stats_cache()
+        try:
+            yield session
+        finally:
+            clear_stats_cache()
+            await session.close()
+            await transaction.rollback()
+
+
+async def _pending_listing(db):
+    """Crea un admin, un vendedor y un listing PENDING; devuelve (admin, listing)."""
+    suffix = uuid4().hex[:8]
+    admin = User(
+        user_id=uuid4(),
+        email=f"admin_{suffix}@example.com",
+        full_name="Admin",
+        role=UserRoleEnum.ADMIN,
+        status=UserStatusEnum.ACTIVE
+    )
+    seller = User(
+        user_id=uuid4(),
+        email=f"seller_{suffix}@example.com",
+        full_name="Seller",
+        status=UserStatusEnum.ACTIVE
+    )
+    category = Category(
+        name=f"Stats_{suffix}",
+        slug=f"stats-{suffix}",
+        type=ListingTypeEnum.PRODUCT
+    )
+    db.add_all([admin, seller, category])
+    await db.flush()
+    listing = Listing(
+        seller_id=seller.user_id,
+        category_id=category.category_id,
+        listing_type=ListingTypeEnum.PRODUCT,
+        title="Pending listing",
+        description="Test",
+        price=Decimal("50.00"),
+        quantity=1,
+        status=ListingStatusEnum.PENDING
+    )
+    db.add(listing)
+    await db.commit()
+    return admin, listing
+
+
+async def _count(db, model, *criteria) -> int:
+    return await db.scalar(select(func.count()).select_from(model).where(*criteria))
+
+
+@pytest.mark.asyncio
+async def test_dashboard_stats_match_individual_counts(db):
+    """
+    Test: La consulta única devuelve los mismos conteos que un COUNT por
+    campo, como StatsDashboard válido.
+    """
+    await _pending_listing(db)
+    stats = await AdminService.get_dashboard_stats(db)
+
+    paid = [OrderStatusEnum.PAID, OrderStatusEnum.SHIPPED, OrderStatusEnum.DELIVERED]
+    revenue = await db.scalar(
+        select(func.coalesce(func.sum(Order.total_amount), 0)).where(Order.order_status.in_(paid))
+    )
+    expected = {
+        "total_users": await _count(db, User),
+        "active_users": await _count(db, User, User.status == UserStatusEnum.ACTIVE),
+        "total_listings": await _count(db, Listing),
+        "pending_listings": await _count(db, Listing, Listing.status == ListingStatusEnum.PENDING),
+        "approved_listings": await _count(db, Listing, Listing.status == ListingStatusEnum.ACTIVE),
+        "rejected_listings": await _count(db, Listing, Listing.status == ListingStatusEnum.REJECTED),
+        "total_orders": await _count(db, Order),
+        "total_revenue": float(revenue),
+        "pending_reports": await _count(db, Report, Report.status == ModerationStatus.PENDING),
+    }
+
+    assert isinstance(stats, StatsDashboard)
+    assert stats.model_dump() == expected
+    assert StatsDashboard.model_validate(stats.model_dump()) == stats
+
+
+@pytest.mark.asyncio
+async def test_dashboard_stats_cache_cleared_by_moderation(db):
+    """
+    Test: La caché se reutiliza entre llamadas y aprobar un listing la
+    descarta, así que pending_listings refleja la acción de inmediato.
+    """
+    admin, listing = await _pending_listing(db)
+
+    before = await AdminService.get_dashboard_stats(db)
+    assert await AdminService.get_dashboard_stats(db) is before
+
+    await AdminService.approve_listing(
+        db, listing.listing_id, admin, ListingModerationAction(reason="ok")
+    )
+
+    assert admin_service._stats_cache is None
+    after = await AdminService.get_dashboard_stats(db)
+    assert after.pending_listings == before.pending_listings - 1
+    assert after.approved_listings == before.approved_listings + 1
@@ -445,10 +445,30 @@ class TestAddressConstraints:
             country="mx"  # Debe ser mayúscula
         )
         db.add(address)
-        
+
         with pytest.raises(IntegrityError):
             db.commit()
 
+    def test_country_schema_normalizes_uppercase(self):
+        """
+        Test that the API schemas uppercase the country before it reaches the DB.
+        """
+        from pydantic import ValidationError
+        from app.schemas.address import AddressCreate, AddressUpdate
+
+        address = AddressCreate(
+            street="Calle Test 123",
+            city="Test",
+            state="Test",
+            postal_code="12345",
+            country="mx"
+        )
+        assert address.country == "MX"
+        assert AddressUpdate(country="us").country == "US"
+
+        with pytest.raises(ValidationError):
+            AddressUpdate(country="mex")
+
     def test_required_fields(self, db, user):
         """
         Autor: Oscar Alonso Nava Rivera
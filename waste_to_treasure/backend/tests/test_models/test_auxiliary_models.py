@@ -236,6 +236,29 @@ class TestShippingMethodModel:
 
         assert method.type == ShippingTypeEnum.DELIVERY
         assert method.cost == Decimal("15.00")
+        assert method.cost_cents == 1500
+
+    def test_bulk_create_shipping_methods(self, db, user):
+        """Test inserting several shipping methods in one batch."""
+        rows = [
+            {"seller_id": user.user_id, "name": f"Method {i}", "cost_cents": i * 100}
+            for i in range(3)
+        ]
+        methods = ShippingMethod.bulk_create(db, rows)
+        db.commit()
+
+        assert [m.name for m in methods] == ["Method 0", "Method 1", "Method 2"]
+        assert all(m.method_id is not None for m in methods)
+        assert all(m.type == ShippingTypeEnum.DELIVERY for m in methods)
+
+    @pytest.mark.parametrize("value", [None, "abc", "NaN", "-1", "21474836.48"])
+    def test_cost_setter_rejects_invalid_values(self, value):
+        """Test that the cost setter raises ValueError for None, non-numeric and out-of-range input."""
+        method = ShippingMethod(name="Invalid cost")
+
+        with pytest.raises(ValueError):
+            method.cost = value
+        assert method.cost_cents is None
 
     def test_shipping_type_enum(self):
         """Test ShippingTypeEnum values."""
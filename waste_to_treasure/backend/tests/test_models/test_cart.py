@@ -229,6 +229,54 @@ class TestCartMethods:
         # Subtotal: 100.00, Commission: 10.00, Total: 110.00
         assert cart.get_estimated_total() == Decimal("110.00")
 
+    def test_convert_cart_to_response_totals(self, db, user, category):
+        """
+        Test convert_cart_to_response sums in cents and rounds the commission half-up.
+        """
+        from app.services.cart_service import convert_cart_to_response
+
+        cart = Cart(user_id=user.user_id)
+        db.add(cart)
+        db.commit()
+
+        listings = [
+            Listing(
+                title=f"Product {i}",
+                description="Test",
+                price=price,
+                seller_id=user.user_id,
+                category_id=category.category_id,
+                listing_type=ListingTypeEnum.PRODUCT,
+                status=listing_status,
+                quantity=100
+            )
+            for i, (price, listing_status) in enumerate([
+                (Decimal("10.05"), ListingStatusEnum.ACTIVE),
+                (Decimal("25.50"), ListingStatusEnum.ACTIVE),
+                (Decimal("99.99"), ListingStatusEnum.INACTIVE),
+            ])
+        ]
+        db.add_all(listings)
+        db.commit()
+
+        db.add_all([
+            CartItem(cart_id=cart.cart_id, listing_id=listings[0].listing_id, quantity=3),
+            CartItem(cart_id=cart.cart_id, listing_id=listings[1].listing_id, quantity=1),
+            CartItem(cart_id=cart.cart_id, listing_id=listings[2].listing_id, quantity=2),
+        ])
+        db.commit()
+        db.refresh(cart)
+
+        response = convert_cart_to_response(cart)
+
+        # 3 * 10.05 + 1 * 25.50 = 55.65; comisión 5.565 -> 5.57
+        assert response.subtotal == cart.get_subtotal() == Decimal("55.65")
+        assert response.estimated_commission == Decimal("5.57")
+        assert response.estimated_total == Decimal("61.22")
+        assert response.total_items == 6
+        assert response.has_unavailable_items is True
+        assert sorted(str(i.item_subtotal) for i in response.items) == ["0.00", "25.50", "30.15"]
+
     def test_clear_cart(self, db, user, category):
         """
         Autor: Oscar Alonso Nava Rivera
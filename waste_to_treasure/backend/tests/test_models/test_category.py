@@ -287,6 +287,113 @@ class TestCategoryHierarchy:
 
         assert grandchild.get_full_path() == f"Electronics_{suffix} > Smartphones_{suffix} > Android_{suffix}"
 
+    def test_full_path_column_follows_renames(self, db):
+        """
+        Test: full_path se guarda al insertar y se propaga a los
+        descendientes cuando cambia el nombre de un ancestro.
+        """
+        suffix = get_unique_suffix()
+        parent = Category(
+            name=f"Electronics_{suffix}",
+            slug=f"electronics-{suffix}",
+            type=ListingTypeEnum.PRODUCT
+        )
+        db.add(parent)
+        db.commit()
+
+        child = Category(
+            name=f"Smartphones_{suffix}",
+            slug=f"smartphones-{suffix}",
+            type=ListingTypeEnum.PRODUCT,
+            parent_category_id=parent.category_id
+        )
+        db.add(child)
+        db.commit()
+
+        grandchild = Category(
+            name=f"Android_{suffix}",
+            slug=f"android-{suffix}",
+            type=ListingTypeEnum.PRODUCT,
+            parent=child
+        )
+        db.add(grandchild)
+        db.commit()
+        assert grandchild.full_path == f"Electronics_{suffix} > Smartphones_{suffix} > Android_{suffix}"
+
+        parent.name = f"Tech_{suffix}"
+        db.commit()
+        db.refresh(child)
+        db.refresh(grandchild)
+
+        assert parent.full_path == f"Tech_{suffix}"
+        assert child.full_path == f"Tech_{suffix} > Smartphones_{suffix}"
+        assert grandchild.full_path == f"Tech_{suffix} > Smartphones_{suffix} > Android_{suffix}"
+
+    def test_full_path_column_follows_parent_change(self, db):
+        """
+        Test: al cambiar parent_category_id con la relación al padre
+        anterior ya cargada, full_path toma la ruta del nuevo padre y los
+        descendientes cargados en la sesión ven la ruta nueva sin refresh.
+        """
+        suffix = get_unique_suffix()
+        old_parent = Category(
+            name=f"Metals_{suffix}",
+            slug=f"metals-{suffix}",
+            type=ListingTypeEnum.MATERIAL
+        )
+        new_parent = Category(
+            name=f"Plastics_{suffix}",
+            slug=f"plastics-{suffix}",
+            type=ListingTypeEnum.MATERIAL
+        )
+        db.add_all([old_parent, new_parent])
+        db.commit()
+
+        child = Category(
+            name=f"Scrap_{suffix}",
+            slug=f"scrap-{suffix}",
+            type=ListingTypeEnum.MATERIAL,
+            parent=old_parent
+        )
+        grandchild = Category(
+            name=f"Shavings_{suffix}",
+            slug=f"shavings-{suffix}",
+            type=ListingTypeEnum.MATERIAL,
+            parent=child
+        )
+        db.add_all([child, grandchild])
+        db.commit()
+        assert child.parent is old_parent
+
+        child.parent_category_id = new_parent.category_id
+        db.commit()
+
+        assert child.full_path == f"Plastics_{suffix} > Scrap_{suffix}"
+        assert grandchild.full_path == f"Plastics_{suffix} > Scrap_{suffix} > Shavings_{suffix}"
+        db.expire_all()
+        assert grandchild.full_path == f"Plastics_{suffix} > Scrap_{suffix} > Shavings_{suffix}"
+
+    def test_full_path_too_long_is_rejected(self, db):
+        """
+        Test: una ruta que no cabe en la columna full_path se rechaza con
+        ValueError en lugar de fallar en la base de datos.
+        """
+        from app.models.category import FULL_PATH_MAX_LENGTH
+
+        suffix = get_unique_suffix()
+        parent = None
+        with pytest.raises(ValueError):
+            for level in range(FULL_PATH_MAX_LENGTH // 100 + 1):
+                parent = Category(
+                    name=f"L{level}_{suffix}".ljust(100, "x"),
+                    slug=f"l{level}-{suffix}",
+                    type=ListingTypeEnum.PRODUCT,
+                    parent=parent
+                )
+                db.add(parent)
+                db.flush()
+        db.rollback()
+
 
 @pytest.mark.models
 @pytest.mark.integration
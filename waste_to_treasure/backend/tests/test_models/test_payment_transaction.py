@@ -883,3 +883,66 @@ class TestPaymentTransactionStatuses:
         assert transaction.is_failed() is True
         assert transaction.error_code == "card_declined"
         assert transaction.error_message is not None
+
+
+class TestPaymentTransactionSchema:
+    """
+    Tests de PaymentTransactionRead construido desde filas de PaymentTransaction.
+    """
+
+    def test_read_schema_round_trips_row(self, db, user):
+        """Test que metadata se lee de la columna transaction_metadata."""
+        from app.schemas.payment import PaymentTransactionRead
+
+        order = Order(
+            buyer_id=user.user_id,
+            order_status=OrderStatusEnum.PAID,
+            subtotal=Decimal("50.00"),
+            commission_amount=Decimal("5.00"),
+            total_amount=Decimal("55.00")
+        )
+        db.add(order)
+        db.commit()
+
+        transaction = PaymentTransaction(
+            order_id=order.order_id,
+            user_id=user.user_id,
+            gateway=PaymentGatewayEnum.STRIPE,
+            gateway_transaction_id=f"ch_schema_{uuid4().hex[:8]}",
+            amount=Decimal("55.00"),
+            status=PaymentStatusEnum.COMPLETED,
+            payment_method_last4="4242",
+            transaction_metadata='{"source": "checkout"}'
+        )
+        db.add(transaction)
+        db.commit()
+        db.expire(transaction)
+
+        read = PaymentTransactionRead.model_validate(transaction)
+        data = PaymentTransactionRead.model_validate_json(read.model_dump_json())
+
+        assert read.metadata == '{"source": "checkout"}'
+        assert data == read
+        assert data.transaction_id == transaction.transaction_id
+        assert data.amount == Decimal("55.00")
+
+    def test_read_schema_from_transient_row(self, user):
+        """Test que una transacción sin guardar no lee el MetaData de SQLAlchemy."""
+        from app.schemas.payment import PaymentTransactionRead
+
+        now = datetime.utcnow()
+        transaction = PaymentTransaction(
+            transaction_id=1,
+            order_id=1,
+            user_id=user.user_id,
+            gateway=PaymentGatewayEnum.STRIPE,
+            gateway_transaction_id="ch_transient",
+            amount=Decimal("10.00"),
+            currency="MXN",
+            status=PaymentStatusEnum.PENDING,
+            initiated_at=now,
+            created_at=now,
+            updated_at=now
+        )
+
+        assert PaymentTransactionRead.model_validate(transaction).metadata is None
@@ -21,7 +21,8 @@ Conceptos clave:
 
 import pytest
 from uuid import uuid4
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError, StatementError
 
 from app.models.user import User, UserRoleEnum, UserStatusEnum
 
@@ -162,6 +163,41 @@ class TestUserModel:
         assert user.role == UserRoleEnum.USER
         assert user.status == UserStatusEnum.PENDING
 
+    def test_user_id_default_is_time_ordered(self, db):
+        """
+        Test that a user created without user_id gets a UUIDv7.
+
+        Los UUIDv7 crecen con el tiempo, así que un usuario creado después
+        siempre tiene un user_id mayor.
+        """
+        first = User(email=f"uuid7_a_{uuid4().hex[:8]}@example.com")
+        db.add(first)
+        db.commit()
+        second = User(email=f"uuid7_b_{uuid4().hex[:8]}@example.com")
+        db.add(second)
+        db.commit()
+
+        assert first.user_id.version == 7
+        assert second.user_id.version == 7
+        assert first.user_id.int >> 80 <= second.user_id.int >> 80
+
+    def test_single_mapper_for_users_table(self):
+        """
+        Test that only one mapped class owns the 'users' table.
+        """
+        from app.core.database import Base
+
+        mappers = [m for m in Base.registry.mappers if m.local_table.name == "users"]
+        assert [m.class_ for m in mappers] == [User]
+
+    def test_repr_of_transient_user(self):
+        """
+        Test that repr() does not fail before the column defaults are applied.
+        """
+        assert repr(User(email="transient@example.com")) == (
+            "User(user_id=None, email='transient@example.com', role=None, status=None)"
+        )
+
 
 @pytest.mark.models
 @pytest.mark.integration
@@ -280,6 +316,24 @@ class TestUserRelationships:
         assert address1 in user.addresses
         assert address2 in user.addresses
 
+    def test_delete_user_cascades_in_database(self, db, user):
+        """
+        Test that deleting a user removes unloaded children via ON DELETE CASCADE.
+        """
+        from app.models.notification import Notification
+
+        db.add(Notification(user_id=user.user_id, type="INFO", content="Hola"))
+        db.commit()
+        db.expire(user)
+
+        db.delete(user)
+        db.commit()
+
+        remaining = db.scalars(
+            select(Notification).where(Notification.user_id == user.user_id)
+        ).all()
+        assert remaining == []
+
 
 @pytest.mark.models
 @pytest.mark.unit
@@ -345,6 +399,40 @@ class TestUserEnums:
 
         assert user.status == UserStatusEnum.BLOCKED
 
+    def test_user_enums_stored_as_char_codes(self, db):
+        """
+        Test that role and status are stored as one-letter codes.
+        """
+        user = User(
+            user_id=uuid4(),
+            email="codes@example.com",
+            role=UserRoleEnum.ADMIN,
+            status=UserStatusEnum.BLOCKED
+        )
+        db.add(user)
+        db.commit()
+
+        row = db.execute(
+            text("SELECT role, status FROM users WHERE user_id = :uid"),
+            {"uid": user.user_id}
+        ).one()
+        assert tuple(row) == ("A", "B")
+
+        fetched = db.scalars(select(User).where(User.status == "BLOCKED")).one()
+        assert fetched.role == UserRoleEnum.ADMIN
+
+    @pytest.mark.parametrize("invalid", ["DELETED", "X", 3])
+    def test_invalid_status_lists_allowed_values(self, db, invalid):
+        """
+        Test that an unknown status is rejected with the allowed values
+        instead of a bare KeyError.
+        """
+        with pytest.raises(StatementError) as exc_info:
+            db.scalars(select(User).where(User.status == invalid)).all()
+
+        assert isinstance(exc_info.value.orig, ValueError)
+        assert "PENDING, ACTIVE, BLOCKED" in str(exc_info.value)
+
 
 @pytest.mark.models
 @pytest.mark.unit
@@ -0,0 +1,197 @@
+"""
+Tests para los mixins compartidos de app.schemas.base.
+"""
+# Descripción: Tests de PaginatedListMixin.json_response y from_orm_trusted.
+
+import importlib
+import json
+import pkgutil
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+import app.schemas
+from app.schemas.address import AddressList, AddressRead
+from app.schemas.base import (
+    PaginatedListMixin,
+    TrustedReadMixin,
+    _construct,
+    _field_plan,
+)
+
+
+def _schema_id(cls: type) -> str:
+    return f"{cls.__module__.rsplit('.', 1)[-1]}.{cls.__name__}"
+
+
+def _schema_subclasses(mixin: type) -> list[type]:
+    """Todas las subclases de `mixin` definidas en app.schemas."""
+    for module in pkgutil.iter_modules(app.schemas.__path__):
+        importlib.import_module(f"app.schemas.{module.name}")
+
+    found, pending = [], list(mixin.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        if cls.__module__.startswith("app.schemas."):
+            found.append(cls)
+    return sorted(found, key=lambda cls: (cls.__module__, cls.__name__))
+
+
+@pytest.mark.unit
+def test_json_response_matches_list_schema():
+    """
+    Test: El JSON de json_response es válido contra el schema *List.
+    """
+    now = datetime.now(timezone.utc)
+    item = AddressRead.model_construct(
+        address_id=1,
+        user_id=uuid4(),
+        street="Calle 1 #2",
+        city="Juárez",
+        state="CHH",
+        postal_code="32000",
+        country="MX",
+        notes=None,
+        is_default=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+    response = AddressList.json_response(items=[item], total=1, page=1, page_size=50)
+
+    assert response.media_type == "application/json"
+    parsed = AddressList.model_validate_json(response.body)
+    assert parsed.total == 1
+    assert parsed.items[0].city == "Juárez"
+    assert json.loads(response.body)["items"][0]["address_id"] == 1
+
+
+@pytest.mark.unit
+def test_json_response_includes_extra_counters():
+    """
+    Test: Los contadores extra del wrapper (unread_count) se agregan al JSON.
+    """
+    from app.schemas.notification import NotificationList
+
+    response = NotificationList.json_response(
+        items=[], total=3, page=1, page_size=20, unread_count=2
+    )
+
+    parsed = NotificationList.model_validate_json(response.body)
+    assert parsed.unread_count == 2
+    assert parsed.total == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "list_schema",
+    _schema_subclasses(PaginatedListMixin),
+    ids=_schema_id,
+)
+def test_json_response_contract(list_schema):
+    """
+    Test: Para cada *List el adapter sale del campo items, el JSON de
+    json_response valida con el propio schema y los campos extra que no
+    declara el wrapper (o los requeridos que faltan) se rechazan.
+    """
+    required = {
+        name: 0 for name, field in list_schema.model_fields.items()
+        if field.is_required() and name not in {"items", "total", "page", "page_size"}
+    }
+
+    adapter = list_schema.items_adapter()
+    response = list_schema.json_response(items=[], total=0, page=1, page_size=20, **required)
+
+    assert adapter.core_schema["type"] == "list"
+    parsed = list_schema.model_validate_json(response.body)
+    assert (parsed.items, parsed.total, parsed.page, parsed.page_size) == ([], 0, 1, 20)
+    assert set(json.loads(response.body)) == {"items", "total", "page", "page_size", *required}
+
+    with pytest.raises(TypeError):
+        list_schema.json_response(
+            items=[], total=0, page=1, page_size=20, undeclared=1, **required
+        )
+    if required:
+        with pytest.raises(TypeError):
+            list_schema.json_response(items=[], total=0, page=1, page_size=20)
+
+
+@pytest.mark.unit
+def test_from_orm_trusted_matches_model_construct():
+    """
+    Test: from_orm_trusted arma lo mismo que model_construct y no comparte
+    defaults mutables entre instancias.
+    """
+    from types import SimpleNamespace
+    from app.schemas.cart import CartRead
+
+    now = datetime.now(timezone.utc)
+    row = SimpleNamespace(cart_id=1, user_id=uuid4(), created_at=now, updated_at=now)
+
+    first = CartRead.from_orm_trusted(row, total_items=2)
+    second = CartRead.from_orm_trusted(row)
+
+    assert first == CartRead.model_construct(
+        _fields_set={"cart_id", "user_id", "created_at", "updated_at", "total_items"},
+        **vars(row),
+        total_items=2,
+    )
+    assert first.model_fields_set == {"cart_id", "user_id", "created_at", "updated_at", "total_items"}
+    assert first.items is not second.items
+    assert list(json.loads(first.model_dump_json())) == list(CartRead.model_fields)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("schema", _schema_subclasses(TrustedReadMixin), ids=_schema_id)
+def test_construct_matches_model_construct(schema):
+    """
+    Test: _construct escribe los mismos slots internos de pydantic que
+    model_construct (__dict__ en el mismo orden, fields_set, extra y
+    private) para cada schema con TrustedReadMixin.
+
+    Fija el comportamiento del atajo frente a cambios de pydantic.
+    """
+    plan = _field_plan(schema)
+    if not plan.direct:
+        pytest.skip("from_orm_trusted usa model_construct para este schema")
+
+    data = {name: f"<{name}>" for name in plan.required}
+
+    fast = _construct(schema, plan, data)
+    reference = schema.model_construct(_fields_set=set(data), **data)
+
+    assert type(fast) is schema
+    for slot in BaseModel.__slots__:
+        assert getattr(fast, slot) == getattr(reference, slot), slot
+    assert list(fast.__dict__) == list(reference.__dict__)
+    for name, value in fast.__dict__.items():
+        if isinstance(value, (list, dict, set)):
+            assert value is not _construct(schema, plan, data).__dict__[name]
+
+
+@pytest.mark.unit
+def test_items_adapter_is_built_lazily_once():
+    """
+    Test: items_adapter no se construye al definir el *List, se deriva del
+    campo items y reutiliza el schema del item en lugar de generarlo otra vez.
+    """
+    from pydantic import ConfigDict
+    from app.schemas.base import PaginatedBase, PaginatedListMixin
+
+    class _ItemRead(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+        name: str
+
+    class _ItemList(PaginatedListMixin, PaginatedBase[_ItemRead]):
+        pass
+
+    assert not _ItemRead.__pydantic_complete__
+
+    adapter = _ItemList.items_adapter()
+
+    assert adapter is _ItemList.items_adapter()
+    assert _ItemRead.__pydantic_complete__
+    assert adapter.validate_python([{"name": "a"}]) == [_ItemRead(name="a")]
@@ -0,0 +1,44 @@
+"""
+Tests para las exportaciones de app.schemas.
+
+Verifica que cada nombre listado en __all__ se pueda resolver mediante
+el __getattr__ perezoso del paquete.
+"""
+# Descripción: Test de consistencia entre __all__ y los schemas exportados.
+
+import pytest
+
+import app.schemas
+
+
+@pytest.mark.unit
+def test_all_exports_resolve():
+    """
+    Test: Todos los nombres de __all__ existen en su submódulo.
+    """
+    missing = [name for name in app.schemas.__all__ if not hasattr(app.schemas, name)]
+    assert missing == []
+
+
+@pytest.mark.unit
+def test_unknown_attribute_raises():
+    """
+    Test: Un nombre no exportado lanza AttributeError.
+    """
+    with pytest.raises(AttributeError):
+        app.schemas.DoesNotExist
+
+
+@pytest.mark.unit
+def test_admin_literals_match_user_enums():
+    """
+    Test: Los Literal de app.schemas.admin (que no importan app.models)
+    siguen sincronizados con UserRoleEnum y UserStatusEnum.
+    """
+    from typing import get_args
+
+    from app.models.user import UserRoleEnum, UserStatusEnum
+    from app.schemas.admin import UserRoleValue, UserStatusValue
+
+    assert set(get_args(get_args(UserRoleValue)[0])) == {m.value for m in UserRoleEnum}
+    assert set(get_args(get_args(UserStatusValue)[0])) == {m.value for m in UserStatusEnum}
@@ -0,0 +1,134 @@
+"""
+Tests para los campos calculados de los schemas de pagos y payouts.
+"""
+# Descripción: Tests de los computed_field de PaymentTransactionRead y PayoutRead.
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.models.payment_enums import (
+    PaymentGatewayEnum,
+    PaymentStatusEnum,
+    PayoutStatusEnum,
+)
+from app.schemas.payment import PaymentTransactionRead
+from app.schemas.payout import PayoutRead
+
+
+def _transaction(**overrides) -> PaymentTransactionRead:
+    now = datetime.now(timezone.utc)
+    data = dict(
+        transaction_id=1,
+        order_id=10,
+        user_id=uuid4(),
+        gateway=PaymentGatewayEnum.STRIPE,
+        gateway_transaction_id="ch_test",
+        amount=Decimal("110.5"),
+        currency="MXN",
+        status=PaymentStatusEnum.COMPLETED,
+        payment_method_last4="4242",
+        initiated_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+    data.update(overrides)
+    return PaymentTransactionRead.model_validate(data)
+
+
+def _payout(**overrides) -> PayoutRead:
+    now = datetime.now(timezone.utc)
+    data = dict(
+        payout_id=1,
+        seller_id=uuid4(),
+        seller_account_id=1,
+        amount=Decimal("850"),
+        currency="MXN",
+        status=PayoutStatusEnum.PENDING,
+        initiated_at=now - timedelta(days=3, hours=1),
+        created_at=now,
+        updated_at=now,
+    )
+    data.update(overrides)
+    return PayoutRead.model_validate(data)
+
+
+@pytest.mark.unit
+def test_transaction_computed_fields():
+    """
+    Test: formatted_amount, masked_payment_method e is_successful se
+    calculan desde las columnas y se incluyen en el JSON.
+    """
+    transaction = _transaction()
+
+    assert transaction.formatted_amount == "$110.50 MXN"
+    assert transaction.masked_payment_method == "•••• 4242"
+    assert transaction.is_successful is True
+
+    data = json.loads(transaction.model_dump_json())
+    assert data["formatted_amount"] == "$110.50 MXN"
+    assert data["masked_payment_method"] == "•••• 4242"
+    assert data["is_successful"] is True
+
+
+@pytest.mark.unit
+def test_transaction_without_last4_and_not_completed():
+    """
+    Test: Sin payment_method_last4 no hay método enmascarado y una
+    transacción no COMPLETED no es exitosa.
+    """
+    transaction = _transaction(
+        payment_method_last4=None,
+        status=PaymentStatusEnum.FAILED,
+    )
+
+    assert transaction.masked_payment_method is None
+    assert transaction.is_successful is False
+    assert json.loads(transaction.model_dump_json())["masked_payment_method"] is None
+
+
+@pytest.mark.unit
+def test_pending_payout_computed_fields():
+    """
+    Test: Un payout PENDING cuenta los días desde initiated_at y puede
+    aprobarse.
+    """
+    payout = _payout()
+
+    assert payout.formatted_amount == "$850.00 MXN"
+    assert payout.days_pending == 3
+    assert payout.can_be_approved is True
+
+    data = json.loads(payout.model_dump_json())
+    assert data["days_pending"] == 3
+    assert data["can_be_approved"] is True
+
+
+@pytest.mark.unit
+def test_pending_payout_with_naive_initiated_at():
+    """
+    Test: days_pending funciona con un initiated_at sin zona horaria.
+    """
+    payout = _payout(initiated_at=datetime.now() - timedelta(days=2, hours=1))
+
+    assert payout.days_pending == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "payout_status",
+    [s for s in PayoutStatusEnum if s != PayoutStatusEnum.PENDING],
+)
+def test_non_pending_payout_computed_fields(payout_status):
+    """
+    Test: Un payout que ya no está PENDING no tiene días pendientes ni
+    puede aprobarse.
+    """
+    payout = _payout(status=payout_status)
+
+    assert payout.days_pending is None
+    assert payout.can_be_approved is False
+    assert payout.formatted_amount == "$850.00 MXN"